@@ -6,6 +6,6 @@ Provides crew runner for orchestrating Writer, Reviewer, and FactChecker agents.
 """
 from __future__ import annotations
 
-from .runner import CrewRunner, get_crew_runner
+from .runner import CrewRunner, close_crew_runners, get_crew_runner
 
-__all__ = ["CrewRunner", "get_crew_runner"]
\ No newline at end of file
+__all__ = ["CrewRunner", "close_crew_runners", "get_crew_runner"]
\ No newline at end of file
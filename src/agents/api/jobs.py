@@ -9,7 +9,6 @@ Architecture:
 """
 from __future__ import annotations
 
-import asyncio
 import logging
 import uuid
 from dataclasses import dataclass, field
@@ -17,7 +16,8 @@ from datetime import datetime
 from enum import Enum
 from typing import Dict, Optional
 
-from ..runner import CrewRunner, CrewResult
+from ..batcher import TopicBatcher
+from ..runner import CrewRunner, CrewResult, get_crew_runner
 
 logger = logging.getLogger(__name__)
 
@@ -77,12 +77,23 @@ class JobManager:
     Attributes:
         jobs: Dictionary of job_id -> Job
         runner: CrewRunner instance
+        batcher: Groups concurrent jobs into batched runs (None = run one by one)
     """
     
     def __init__(self):
         """Initialize job manager with empty job dictionary."""
         self.jobs: Dict[str, Job] = {}
-        self.runner = CrewRunner()
+        # Async jobs have always run without TruLens monitoring (CrewRunner default)
+        self.runner: CrewRunner = get_crew_runner(enable_monitoring=False)
+        
+        crew_cfg = self.runner.config.agents.crew
+        self.batcher: Optional[TopicBatcher] = None
+        if crew_cfg.batch_max_size > 1:
+            self.batcher = TopicBatcher(
+                self.runner,
+                max_batch=crew_cfg.batch_max_size,
+                max_wait=crew_cfg.batch_max_wait_ms / 1000,
+            )
     
     def create_job(self, topic: str, language: str) -> str:
         """
@@ -128,18 +139,13 @@ class JobManager:
             job.progress = 0.1
             logger.info("Starting job %s", job_id)
             
-            # Execute crew in thread pool (CPU-bound work)
-            loop = asyncio.get_event_loop()
-            
             job.progress = 0.3
             
-            # Run crew workflow (this is the slow part)
-            result = await loop.run_in_executor(
-                None,  # Use default executor
-                self.runner.run,
-                job.topic,
-                job.language,
-            )
+            # Run crew workflow (this is the slow part; blocking steps run in threads)
+            if self.batcher is not None:
+                result = await self.batcher.submit(job.topic, job.language)
+            else:
+                result = await self.runner.arun(job.topic, job.language)
             
             job.progress = 0.9
             
@@ -213,4 +219,13 @@ def get_job_manager() -> JobManager:
     global _job_manager
     if _job_manager is None:
         _job_manager = JobManager()
-    return _job_manager
\ No newline at end of file
+    return _job_manager
+
+
+async def close_job_manager() -> None:
+    """Stop the global job manager's batcher and drop the manager, if one was ever created."""
+    global _job_manager
+    if _job_manager is not None and _job_manager.batcher is not None:
+        await _job_manager.batcher.close()
+    # The manager holds the shared runner, which is closed next
+    _job_manager = None
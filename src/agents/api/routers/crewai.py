@@ -26,8 +26,6 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-runner = get_crew_runner()
-
 
 @router.get(
     "/health",
@@ -72,7 +70,8 @@ def run_crew_sync(request: CrewRunRequest) -> CrewRunResponse:
             request.language,
         )
         
-        # Execute crew workflow
+        # Execute crew workflow (looked up per request: shutdown closes the shared runner)
+        runner = get_crew_runner()
         result = runner.run(topic=request.topic, language=request.language)
 
         # Save outputs to files
@@ -208,11 +207,9 @@ def get_job_status(job_id: str) -> CrewStatusResponse:
             completed_at=job.completed_at.isoformat() if job.completed_at else None,
             result=job.result.final_output if job.result else None,
             error=job.error,
+            evaluation=job.result.evaluation if job.result and job.result.evaluation else None,
         )
         
-        if job.result and job.result.evaluation:
-            response.evaluation = job.result.evaluation
-        
         return response
         
     except HTTPException:
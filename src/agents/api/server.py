@@ -10,19 +10,33 @@ Architecture:
 from __future__ import annotations
 
 import logging
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
 from ...utils.logging import setup_logging
+from ..runner import close_crew_runners
+from .jobs import close_job_manager
 from .routers import crewai
 
 setup_logging(level="INFO", service_name="crewai-service")
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    """Release the job batcher and shared CrewRunners (worker pools, Weaviate client) on shutdown."""
+    yield
+    await close_job_manager()
+    close_crew_runners()
+    logger.info("✓ CrewRunners closed")
+
+
 app = FastAPI(
     title="Research-Assistant-CrewAI-Service",
     description="Agentic workflow service using CrewAI for multi-agent orchestration.",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 app.include_router(crewai.router)
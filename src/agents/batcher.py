@@ -0,0 +1,153 @@
+"""
+Topic Batcher.
+
+Groups crew requests that arrive close together into one batched run, so
+concurrent topics share a single embedding pass and one round-trip of
+RAG retrieval instead of paying them one by one.
+
+A request waits at most ``max_wait`` seconds for others to join; a batch
+is dispatched as soon as it holds ``max_batch`` topics.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .runner import CrewResult, CrewRunner
+
+logger = logging.getLogger(__name__)
+
+
+class TopicBatcher:
+    """
+    Queue that batches crew requests for CrewRunner.run_batch().
+
+    Must be used from a single event loop. Batches are dispatched as
+    background tasks, so the next batch collects while earlier ones run.
+
+    Usage:
+        batcher = TopicBatcher(get_crew_runner(), max_batch=8, max_wait=0.075)
+        result = await batcher.submit("What is RAG?", "en")
+        ...
+        await batcher.close()
+    """
+
+    def __init__(self, runner: CrewRunner, max_batch: int = 8, max_wait: float = 0.075):
+        """
+        Initialize batcher.
+
+        Args:
+            runner: Runner that executes the batches
+            max_batch: Maximum number of topics per batch
+            max_wait: Maximum seconds the first topic waits for a batch to fill
+        """
+        self.runner = runner
+        self.max_batch = max(1, max_batch)
+        self.max_wait = max_wait
+
+        # Created on first submit, inside the running event loop
+        self._queue: asyncio.Queue[tuple[str, str, asyncio.Future]] | None = None
+        self._collector: asyncio.Task | None = None
+        self._dispatches: set[asyncio.Task] = set()
+
+        logger.info("TopicBatcher initialized (max_batch=%d, max_wait=%.3fs)", self.max_batch, max_wait)
+
+    async def submit(self, topic: str, language: str = "en") -> CrewResult:
+        """
+        Queue a topic and wait for its result.
+
+        Args:
+            topic: Research topic/question
+            language: Target language
+
+        Returns:
+            CrewResult for the topic
+
+        Raises:
+            Exception: Whatever the batched run raised for this topic
+        """
+        if self._collector is None or self._collector.done():
+            self._queue = asyncio.Queue()
+            self._collector = asyncio.create_task(self._collect())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((topic, language, future))
+        return await future
+
+    async def _collect(self) -> None:
+        """Form batches from the queue until cancelled."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+
+            try:
+                while len(batch) < self.max_batch:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                # Closed while this batch was still filling
+                self._reject(batch)
+                raise
+
+            task = asyncio.create_task(self._dispatch(batch))
+            self._dispatches.add(task)
+            task.add_done_callback(self._dispatches.discard)
+
+    async def _dispatch(self, batch: list[tuple[str, str, asyncio.Future]]) -> None:
+        """
+        Run one batch and hand each result to its waiting caller.
+
+        Args:
+            batch: Queued (topic, language, future) entries
+        """
+        logger.info("Dispatching batch of %d topics", len(batch))
+        try:
+            results = await self.runner.run_batch(
+                [topic for topic, _, _ in batch],
+                [language for _, language, _ in batch],
+            )
+        except Exception as e:
+            logger.exception("Batched crew run failed: %s", e)
+            results = [e] * len(batch)
+
+        for (_, _, future), result in zip(batch, results, strict=True):
+            if future.done():
+                # Caller gave up (cancelled) while the batch was running
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def close(self) -> None:
+        """Stop collecting, wait for running batches and fail queued requests."""
+        if self._collector is not None:
+            self._collector.cancel()
+            await asyncio.gather(self._collector, return_exceptions=True)
+            self._collector = None
+
+        if self._dispatches:
+            await asyncio.gather(*self._dispatches, return_exceptions=True)
+
+        while self._queue is not None and not self._queue.empty():
+            self._reject([self._queue.get_nowait()])
+
+    @staticmethod
+    def _reject(entries: list[tuple[str, str, asyncio.Future]]) -> None:
+        """
+        Fail queued requests that will never be dispatched.
+
+        Args:
+            entries: Queued (topic, language, future) entries
+        """
+        for _, _, future in entries:
+            if not future.done():
+                future.set_exception(RuntimeError("TopicBatcher closed"))
@@ -0,0 +1,155 @@
+"""
+Semantic Result Cache.
+
+Serves a previous CrewResult when a new topic is a near-duplicate of one
+that was already answered (same language, cosine similarity above a
+threshold), so repeated or lightly rephrased questions skip the crew.
+
+Embeddings are stored unit-normalized and int8-quantized with a
+per-vector scale, which keeps the cache ~4x smaller than float32 and
+lets one integer matrix-vector product score every entry at once.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from .runner import CrewResult
+
+logger = logging.getLogger(__name__)
+
+
+class SemanticCache:
+    """
+    Bounded cache of crew results keyed by topic embedding.
+
+    Entries live in a fixed-size ring buffer: once full, the oldest entry
+    is overwritten. Thread-safe.
+
+    Usage:
+        cache = SemanticCache(max_entries=128, threshold=0.95)
+
+        hit = cache.lookup(embedding, "en")
+        if hit is None:
+            result = ...
+            cache.add(embedding, result)
+    """
+
+    def __init__(self, max_entries: int = 128, threshold: float = 0.95):
+        """
+        Initialize cache.
+
+        Args:
+            max_entries: Maximum number of cached results
+            threshold: Minimum cosine similarity for a hit
+        """
+        self.max_entries = max_entries
+        self.threshold = threshold
+
+        # Allocated on first add, once the embedding dimension is known
+        self._vectors: np.ndarray | None = None
+        self._scales = np.zeros(max_entries, dtype=np.float32)
+        self._languages: list[str | None] = [None] * max_entries
+        self._results: list[CrewResult | None] = [None] * max_entries
+        self._size = 0
+        self._next = 0
+        self._lock = threading.Lock()
+
+        logger.info("SemanticCache initialized (max_entries=%d, threshold=%.2f)", max_entries, threshold)
+
+    @staticmethod
+    def _quantize(embedding: Sequence[float]) -> tuple[np.ndarray, float]:
+        """
+        Normalize an embedding and quantize it to int8.
+
+        Args:
+            embedding: Raw embedding vector
+
+        Returns:
+            Tuple of (int8 vector, scale) with vector * scale ≈ unit embedding
+        """
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        if norm > 0:
+            vector = vector / norm
+
+        peak = float(np.abs(vector).max()) if vector.size else 0.0
+        scale = peak / 127 if peak > 0 else 1.0
+        return np.round(vector / scale).astype(np.int8), scale
+
+    def lookup(self, embedding: Sequence[float], language: str) -> tuple[CrewResult, float] | None:
+        """
+        Find the most similar cached result for a topic.
+
+        Args:
+            embedding: Embedding of the new topic
+            language: Target language of the new request
+
+        Returns:
+            Tuple of (cached result, similarity), or None on a miss
+        """
+        query, query_scale = self._quantize(embedding)
+
+        with self._lock:
+            if self._size == 0 or self._vectors.shape[1] != query.shape[0]:
+                return None
+
+            # int32 accumulation: 127 * 127 * dim stays far below overflow
+            dots = self._vectors[:self._size].astype(np.int32) @ query.astype(np.int32)
+            scores = dots * self._scales[:self._size] * query_scale
+
+            for i, entry_language in enumerate(self._languages[:self._size]):
+                if entry_language != language:
+                    scores[i] = -1.0
+
+            best = int(np.argmax(scores))
+            similarity = float(scores[best])
+            if similarity < self.threshold:
+                return None
+
+            return self._results[best], similarity
+
+    def add(self, embedding: Sequence[float], result: CrewResult) -> None:
+        """
+        Cache a result under its topic embedding.
+
+        Args:
+            embedding: Embedding of the result's topic
+            result: Result to serve for similar topics
+        """
+        vector, scale = self._quantize(embedding)
+
+        with self._lock:
+            if self._vectors is None or self._vectors.shape[1] != vector.shape[0]:
+                # First entry (or embedding model changed): start over
+                self._vectors = np.zeros((self.max_entries, vector.shape[0]), dtype=np.int8)
+                self._size = 0
+                self._next = 0
+
+            slot = self._next
+            self._vectors[slot] = vector
+            self._scales[slot] = scale
+            self._languages[slot] = result.language
+            self._results[slot] = result
+
+            self._next = (slot + 1) % self.max_entries
+            self._size = min(self._size + 1, self.max_entries)
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        with self._lock:
+            self._vectors = None
+            self._languages = [None] * self.max_entries
+            self._results = [None] * self.max_entries
+            self._size = 0
+            self._next = 0
+        logger.info("SemanticCache cleared")
+
+    def __len__(self) -> int:
+        """Number of cached results."""
+        return self._size
@@ -32,6 +32,16 @@ from ..tasks import (
 )
  
 logger = logging.getLogger(__name__)
+
+# Explicit strings returned by the RAG pipeline when no vector matches are
+# found; they always open the context, so only its head is searched
+_NO_CONTEXT_INDICATORS = (
+    "⚠️ NO CONTEXT AVAILABLE ⚠️",
+    "NO CONTEXT AVAILABLE",
+    "No context available",
+    "No documents were retrieved",
+)
+_NO_CONTEXT_SCAN_CHARS = 256
  
  
 class ResearchCrew:
@@ -111,15 +121,9 @@ class ResearchCrew:
        
         # We catch explicit strings returned by the RAG pipeline when no vector 
         # matches are found to avoid passing "error messages" as factual context.
-        no_context_indicators = [
-            "⚠️ NO CONTEXT AVAILABLE ⚠️",
-            "NO CONTEXT AVAILABLE",
-            "No context available",
-            "No documents were retrieved",
-        ]
-       
-        for indicator in no_context_indicators:
-            if indicator in context:
+        head = context[:_NO_CONTEXT_SCAN_CHARS]
+        for indicator in _NO_CONTEXT_INDICATORS:
+            if indicator in head:
                 logger.debug("Context validation failed: contains '%s'", indicator)
                 return False
        
@@ -230,7 +234,8 @@ class ResearchCrew:
         factchecker_task = create_factchecker_task(
             agent=self.factchecker,
             reviewer_task=reviewer_task,
-            context=optimized_context
+            context=optimized_context,
+            source_context=context
         )
        
         tasks = [writer_task, reviewer_task, factchecker_task]
@@ -455,5 +460,5 @@ class ResearchCrew:
                 current_header = ""
     
         result = "\n".join(optimized_output)
-        logger.info(f"Metadata extracted: {len(result)} chars")
+        logger.info("Metadata extracted: %d chars", len(result))
         return result
\ No newline at end of file
@@ -5,33 +5,80 @@ Main orchestrator for RAG + CrewAI workflow execution.
 Manages RAG retrieval, agent execution, evaluation, and output generation.
 
 Architecture:
-    Singleton pattern - initializes components once and reuses them.
+    Singleton pattern - initializes components lazily on first use and reuses them.
     Coordinates: RAG Pipeline → Crew Execution → Evaluation → Output.
 """
 from __future__ import annotations
 
-import hashlib
+import asyncio
 import logging
-import re
-from dataclasses import dataclass
+import os
+import queue
+import threading
+import time
+import uuid
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass, field, replace
 from datetime import datetime
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import TYPE_CHECKING, Any, Callable, Iterator
 
 from crewai import LLM
-from haystack.dataclasses import Document
 
 from ..rag.core.pipeline import RAGPipeline
-from ..eval.guardrails import InputValidator, OutputValidator, load_guardrails_config
+from ..eval.guardrails import InputValidator, OutputValidator, ValidationResult, load_guardrails_config
 from ..eval.performance import PerformanceTracker
 from ..eval.trulens import TruLensClient
 from ..utils.config import load_config
+from .cache import SemanticCache
 from .crews import ResearchCrew
 
+if TYPE_CHECKING:
+    from haystack.dataclasses import Document
+
 logger = logging.getLogger(__name__)
 
+# Maximum length of output folder slugs
+_SLUG_MAX_LEN = 50
+
+# Performance-tracker phase names (keys of evaluation["performance"]["components"])
+_PHASE_RAG = "rag_retrieval"
+_PHASE_GUARD_IN = "guardrails_input"
+_PHASE_CREW = "crew_execution"
+_PHASE_GUARD_OUT = "guardrails_output"
+_PHASE_TRULENS = "trulens_evaluation"
+
+# How long a finished background evaluation waits to be fetched
+_EVAL_RESULT_TTL_SECONDS = 600.0
 
-@dataclass
+# Output templates (parsed once, filled per chunk / per result)
+_CHUNK_TMPL = "SOURCE [{n}]: {src}\n{metaline}{body}\n"
+_META_TMPL = "METADATA: {meta}\n"
+_MD_HEADER_TMPL = (
+    "# Research Summary: {topic}\n\n"
+    "**Language:** {language}\n"
+    "**Generated:** {generated}\n"
+    "**Sources:** {count} documents\n\n"
+    "---\n\n"
+)
+
+
+def _release_resources(executors: tuple[ThreadPoolExecutor, ...], closeables: list[Any]) -> None:
+    """Shut down a runner's worker pools and close its lazily created resources."""
+    for executor in executors:
+        executor.shutdown(wait=False)
+    for resource in closeables:
+        try:
+            resource.close()
+            logger.debug("%s closed", type(resource).__name__)
+        except Exception as e:
+            logger.warning("Error closing %s: %s", type(resource).__name__, e)
+
+
+@dataclass(frozen=True, slots=True)
 class CrewResult:
     """
     Result from crew execution.
@@ -42,20 +89,24 @@ class CrewResult:
         final_output: Final generated summary
         context_docs: Retrieved documents from RAG
         evaluation: Evaluation metrics (performance, TruLens, guardrails)
+        source_map: Source name -> citation number, in citation order
+        generated_at: Time the result was produced (used for output naming)
     """
     topic: str
     language: str
     final_output: str
-    context_docs: List[Document]
-    evaluation: Dict[str, Any] = None
+    context_docs: list[Document]
+    evaluation: dict[str, Any] = field(default_factory=dict)
+    source_map: dict[str, int] | None = None
+    generated_at: datetime = field(default_factory=datetime.now)
 
 
 class CrewRunner:
     """
     Orchestrates RAG retrieval + CrewAI execution.
     
-    Main entry point for the agentic workflow. Initializes all components once
-    (singleton pattern) and reuses them across requests for better performance.
+    Main entry point for the agentic workflow. Initializes each component on
+    first use (lazy singleton pattern) and reuses it across requests.
     
     Attributes:
         config: Application configuration
@@ -65,115 +116,206 @@ class CrewRunner:
         input_validator: Input safety validator
         output_validator: Output safety validator
         trulens_client: TruLens evaluation client
-        performance_tracker: Performance metrics tracker
+        performance_tracker: Performance tracker of the most recent run
+        background_evaluation: Run TruLens off the request path
     """
 
-    def __init__(self, enable_guardrails: bool = True, enable_monitoring: bool = False):
+    def __init__(
+        self,
+        enable_guardrails: bool = True,
+        enable_monitoring: bool = False,
+        background_evaluation: bool = False,
+        semantic_cache: bool | None = None,
+    ):
         """
-        Initialize runner with RAG pipeline, LLM, crew, and optional safety/monitoring.
+        Initialize runner configuration; heavy components are created lazily.
+
+        RAG pipeline, LLM, crew, guardrails and TruLens are built on first
+        access, so a process only pays for the components it actually uses.
 
         Args:
             enable_guardrails: Enable safety checks on inputs/outputs
             enable_monitoring: Enable TruLens monitoring
+            background_evaluation: Return results without waiting for TruLens;
+                scores are fetched later via get_evaluation()
+            semantic_cache: Serve cached results for near-duplicate topics
+                (None = use agents.crew.semantic_cache from config)
         """
         logger.info("Initializing CrewRunner...")
         
         self.config = load_config()
-        self.rag_pipeline = None  # Initialize to None first
+        self.enable_guardrails = enable_guardrails
+        self.enable_monitoring = enable_monitoring
+        self.background_evaluation = background_evaluation
         
-        # Initialize RAG pipeline for document retrieval
+        # Results for near-duplicate topics (None = disabled)
+        crew_cfg = self.config.agents.crew
+        if semantic_cache is None:
+            semantic_cache = crew_cfg.semantic_cache
+        self.semantic_cache: SemanticCache | None = None
+        if semantic_cache and crew_cfg.semantic_cache_size > 0:
+            self.semantic_cache = SemanticCache(
+                max_entries=crew_cfg.semantic_cache_size,
+                threshold=crew_cfg.semantic_cache_threshold,
+            )
+        
+        # Saved outputs; base directories are created once, then only leaves
+        self.output_base_dir = Path(crew_cfg.output_dir)
+        self._ensured_output_dirs: set[Path] = set()
+        
+        # Context budget in characters (~4 characters per token)
+        self.max_context_chars = self.config.rag.max_context_tokens * 4
+        
+        # Shared worker pool for independent per-request steps
+        self._executor = ThreadPoolExecutor(
+            max_workers=min(8, os.cpu_count() or 1),
+            thread_name_prefix="crew-runner",
+        )
+        
+        # Crew agents are stateful, so each in-flight run checks out its own
+        # crew; crews are built on demand up to max_concurrency, then reused
+        self._crew_pool_size = max(1, self.config.agents.crew.max_concurrency)
+        self._idle_crews: queue.SimpleQueue[ResearchCrew] = queue.SimpleQueue()
+        self._crews_built = 0
+        self._crew_pool_lock = threading.Lock()
+        
+        # Small dedicated pool so slow evaluations never starve retrieval
+        self._eval_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="crew-eval")
+        self._pending_evals: dict[str, Future] = {}
+        # eval_id -> (finished at, result); expired entries are dropped
+        self._finished_evals: dict[str, tuple[float, dict[str, Any] | None]] = {}
+        self._evals_lock = threading.Lock()
+        
+        # Cleanup runs on close(), on garbage collection or at interpreter exit,
+        # whichever comes first; closeables are registered as they are created
+        self._closeables: list[Any] = []
+        self._finalizer = weakref.finalize(
+            self, _release_resources, (self._executor, self._eval_pool), self._closeables
+        )
+        
+        # Performance tracker
+        self.performance_tracker = PerformanceTracker()
+        
+        logger.info("=" * 70)
+        logger.info("CrewRunner initialization complete")
+        logger.info("  Guardrails: %s", "enabled" if enable_guardrails else "disabled")
+        logger.info("  Monitoring: %s", "enabled" if enable_monitoring else "disabled")
+        logger.info("  Evaluation: %s", "background" if background_evaluation else "inline")
+        logger.info("  Semantic cache: %s", "enabled" if self.semantic_cache else "disabled")
+        logger.info("  Components: lazy (initialized on first use, then reused)")
+        logger.info("=" * 70)
+
+    @cached_property
+    def rag_pipeline(self) -> RAGPipeline | None:
+        """RAG pipeline for document retrieval, or None if unavailable."""
         # Uses try-except because RAG might not be available in all environments
         try:
-            self.rag_pipeline = RAGPipeline.from_existing()
+            rag_pipeline = RAGPipeline.from_existing()
+            self._closeables.append(rag_pipeline)
             logger.info("✓ RAG pipeline initialized successfully")
+            return rag_pipeline
         except Exception as e:
             logger.warning(
                 "Failed to initialize RAG pipeline: %s.", e
             )
             logger.info(
-                "RAG pipeline will be initialized on first use. "
                 "Collection will be created when you run ingestion."
             )
-            self.rag_pipeline = None
-        
-        # Initialize LLM
+            return None
+
+    @cached_property
+    def llm(self) -> LLM:
+        """Language model shared by all agents (and all runs of this runner)."""
         try:
             llm_host = self.config.llm.host
             llm_model = self.config.llm.model
             agent_temperature = self.config.agents.llm.temperature
             
-            self.llm = LLM(
+            llm = LLM(
                 model=f"ollama/{llm_model}",
                 base_url=llm_host,
                 temperature=agent_temperature,
+                timeout=self.config.llm.request_timeout,
             )
             logger.info("✓ LLM initialized: %s at %s", llm_model, llm_host)
+            return llm
         except Exception as e:
-            # If LLM init fails, clean up pipeline before re-raising
-            if self.rag_pipeline is not None:
-                try:
-                    self.rag_pipeline.close()
-                except Exception:
-                    pass
             raise RuntimeError(f"Failed to initialize LLM: {e}") from e
-        
-        # Initialize crew (reused across requests)
+
+    @cached_property
+    def crew(self) -> ResearchCrew:
+        """ResearchCrew instance (reused across requests)."""
         try:
-            self.crew = ResearchCrew(self.llm)
+            crew = ResearchCrew(self.llm)
             logger.info("✓ ResearchCrew initialized")
+            return crew
         except Exception as e:
-            # Clean up on failure
-            if self.rag_pipeline is not None:
-                try:
-                    self.rag_pipeline.close()
-                except Exception:
-                    pass
             raise RuntimeError(f"Failed to initialize crew: {e}") from e
-        
-        # Initialize optional safety and monitoring components
-        self.input_validator = None
-        self.output_validator = None
-        self.trulens_client = None
-        
-        if enable_guardrails:
-            try:
-                guardrails_config = load_guardrails_config()
-                self.input_validator = InputValidator(guardrails_config)
-                self.output_validator = OutputValidator(guardrails_config)
-                logger.info("✓ Guardrails enabled")
-            except Exception as e:
-                logger.warning("Failed to initialize guardrails: %s", e)
-        
-        if enable_monitoring:
-            try:
-                self.trulens_client = TruLensClient(enabled=True)
-                logger.info("✓ TruLens monitoring enabled")
-            except Exception as e:
-                logger.warning("Failed to initialize TruLens: %s", e)
-        
-        # Performance tracker
-        self.performance_tracker = PerformanceTracker()
-        
-        logger.info("=" * 70)
-        logger.info("CrewRunner initialization complete")
-        logger.info("  RAG: %s", "enabled" if self.rag_pipeline else "disabled")
-        logger.info("  Guardrails: %s", "enabled" if self.input_validator else "disabled")
-        logger.info("  Monitoring: %s", "enabled" if self.trulens_client else "disabled")
-        logger.info("  Crew: singleton (reused across requests)")
-        logger.info("=" * 70)
 
-    def __del__(self):
-        """Destructor - cleanup resources."""
+    @cached_property
+    def input_validator(self) -> InputValidator | None:
+        """Input safety validator, or None if guardrails are disabled."""
+        if not self.enable_guardrails:
+            return None
+        try:
+            input_validator = InputValidator(load_guardrails_config())
+            logger.info("✓ Input guardrails enabled")
+            return input_validator
+        except Exception as e:
+            logger.warning("Failed to initialize input guardrails: %s", e)
+            return None
+
+    @cached_property
+    def _validate_input(self) -> Callable[[str], tuple[bool, tuple[ValidationResult, ...]]] | None:
+        """Memoized input check (rules are pure, so retried topics reuse the verdict)."""
+        validator = self.input_validator
+        if validator is None:
+            return None
+
+        @lru_cache(maxsize=1024)
+        def validate(topic: str) -> tuple[bool, tuple[ValidationResult, ...]]:
+            passed, results = validator.validate(topic)
+            return passed, tuple(results)
+
+        return validate
+
+    @cached_property
+    def output_validator(self) -> OutputValidator | None:
+        """Output safety validator, or None if guardrails are disabled."""
+        if not self.enable_guardrails:
+            return None
+        try:
+            output_validator = OutputValidator(load_guardrails_config())
+            logger.info("✓ Output guardrails enabled")
+            return output_validator
+        except Exception as e:
+            logger.warning("Failed to initialize output guardrails: %s", e)
+            return None
+
+    @cached_property
+    def trulens_client(self) -> TruLensClient | None:
+        """TruLens evaluation client, or None if monitoring is disabled."""
+        if not self.enable_monitoring:
+            return None
+        try:
+            trulens_client = TruLensClient(enabled=True)
+            logger.info("✓ TruLens monitoring enabled")
+            return trulens_client
+        except Exception as e:
+            logger.warning("Failed to initialize TruLens: %s", e)
+            return None
+
+    def __enter__(self) -> CrewRunner:
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit - cleanup resources."""
         self.close()
 
     def close(self):
-        """Close and cleanup all resources."""
-        if self.rag_pipeline is not None:
-            try:
-                self.rag_pipeline.close()
-                logger.debug("RAG pipeline closed")
-            except Exception as e:
-                logger.warning("Error closing RAG pipeline: %s", e)
+        """Close and cleanup all resources (safe to call more than once)."""
+        self._finalizer()
 
     def run(self, topic: str, language: str = "en") -> CrewResult:
         """
@@ -188,37 +330,447 @@ class CrewRunner:
         """
         logger.info("Starting crew run for topic: %s (language: %s)", topic, language)
         
-        self.performance_tracker.start()
+        tracker = self._start_tracker()
+        
+        hit, query_embedding = self._lookup_cache(topic, language)
+        if hit is not None:
+            return self._check_input(topic, language, tracker) or self._serve_cached(topic, *hit, tracker)
 
-        # Input validation using guardrails
-        if self.input_validator:
-            with self.performance_tracker.track("guardrails_input"):
-                passed, results = self.input_validator.validate(topic)
-                
-                if not passed:
-                    errors = [r.message for r in results if not r.passed]
-                    error_msg = "; ".join(errors)
-                    
-                    logger.error("Input validation failed: %s", error_msg)
-                    self.performance_tracker.stop()
-                    
-                    return CrewResult(
-                        topic=topic,
-                        language=language,
-                        final_output=f"⚠️ Safety check failed: {error_msg}",
-                        context_docs=[],
-                        evaluation={
-                            "guardrails": {
-                                "input_passed": False,
-                                "violations": errors,
-                            },
-                            "performance": self.performance_tracker.get_summary(),
-                        },
-                    )
+        # Step 1: Retrieve context from RAG in the background; retrieval does
+        # not depend on the input check, so its latency hides behind it.
+        # The crew is built alongside (a no-op once it exists).
+        context_future = self._executor.submit(self.retrieve_context, topic, tracker)
+        self._executor.submit(self._warm_crew)
+
+        rejected = self._check_input(topic, language, tracker)
+        if rejected is not None:
+            context_future.cancel()
+            return rejected
+        
+        context, docs, source_map = context_future.result()
+        
+        result = self._generate(topic, language, context, docs, source_map, tracker)
+        self._remember(query_embedding, result)
+        return result
+
+    async def arun(self, topic: str, language: str = "en") -> CrewResult:
+        """
+        Execute the full RAG + CrewAI workflow without blocking the event loop.
+        
+        Retrieval, input validation and (on first use) crew construction run
+        concurrently in worker threads; the crew and output checks follow in
+        a worker thread as well.
+        
+        Args:
+            topic: Research topic/question
+            language: Target language (en, de, fr, es, etc.)
+            
+        Returns:
+            CrewResult with final output and evaluation metrics
+        """
+        logger.info("Starting async crew run for topic: %s (language: %s)", topic, language)
         
-        # Step 1: Retrieve context from RAG
-        context, docs = self.retrieve_context(topic)
+        tracker = self._start_tracker()
         
+        hit, query_embedding = await asyncio.to_thread(self._lookup_cache, topic, language)
+        if hit is not None:
+            return self._check_input(topic, language, tracker) or self._serve_cached(topic, *hit, tracker)
+        
+        (context, docs, source_map), rejected, _ = await asyncio.gather(
+            asyncio.to_thread(self.retrieve_context, topic, tracker),
+            asyncio.to_thread(self._check_input, topic, language, tracker),
+            asyncio.to_thread(self._warm_crew),
+        )
+        if rejected is not None:
+            return rejected
+        
+        result = await asyncio.to_thread(
+            self._generate, topic, language, context, docs, source_map, tracker
+        )
+        self._remember(query_embedding, result)
+        return result
+
+    async def run_many(
+        self,
+        topics: list[str],
+        language: str = "en",
+        concurrency: int | None = None,
+    ) -> list[CrewResult | BaseException]:
+        """
+        Execute the workflow for several topics concurrently.
+        
+        At most ``concurrency`` runs are in flight at once. Raise Ollama's
+        OLLAMA_NUM_PARALLEL to match, otherwise the LLM serializes them anyway.
+        
+        Args:
+            topics: Research topics/questions
+            language: Target language for all topics
+            concurrency: Max runs in flight (default: agents.crew.max_concurrency)
+            
+        Returns:
+            One CrewResult per topic, in order; a failed run yields its exception
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency or self.config.agents.crew.max_concurrency))
+        
+        async def bounded(topic: str) -> CrewResult:
+            async with semaphore:
+                return await self.arun(topic, language)
+        
+        logger.info("Starting batch of %d crew runs", len(topics))
+        return await asyncio.gather(*(bounded(topic) for topic in topics), return_exceptions=True)
+
+    async def run_batch(
+        self, topics: list[str], languages: list[str] | None = None
+    ) -> list[CrewResult | BaseException]:
+        """
+        Execute the workflow for a batch of topics with shared retrieval.
+        
+        All topics are embedded in one encoder pass; those embeddings serve
+        the semantic cache lookups and a single batched RAG call. Input
+        checks run alongside retrieval, then crews run up to
+        agents.crew.max_concurrency at once.
+        
+        Args:
+            topics: Research topics/questions
+            languages: Target language per topic (default: "en" for all)
+            
+        Returns:
+            One CrewResult per topic, in order; a failed run yields its exception
+        """
+        if languages is None:
+            languages = ["en"] * len(topics)
+        
+        logger.info("Starting batched crew run for %d topics", len(topics))
+        
+        trackers = [self._start_tracker() for _ in topics]
+        embeddings = await asyncio.to_thread(self._embed_topics, topics)
+        
+        results: list[CrewResult | BaseException | None] = [None] * len(topics)
+        pending = []
+        for i, (topic, language) in enumerate(zip(topics, languages, strict=True)):
+            hit = None
+            if self.semantic_cache is not None and embeddings is not None:
+                hit = self.semantic_cache.lookup(embeddings[i], language)
+            if hit is None:
+                pending.append(i)
+            else:
+                results[i] = self._check_input(topic, language, trackers[i]) or self._serve_cached(
+                    topic, *hit, trackers[i]
+                )
+        
+        if not pending:
+            return results
+        
+        # One retrieval for the whole batch, timed once and credited to every run
+        batch_tracker = PerformanceTracker()
+        retrieved, rejections, _ = await asyncio.gather(
+            asyncio.to_thread(
+                self.retrieve_context_batch,
+                [topics[i] for i in pending],
+                batch_tracker,
+                None if embeddings is None else [embeddings[i] for i in pending],
+            ),
+            asyncio.gather(*(
+                asyncio.to_thread(self._check_input, topics[i], languages[i], trackers[i]) for i in pending
+            )),
+            asyncio.to_thread(self._warm_crew),
+        )
+        retrieval_time = batch_tracker.get_metrics().get(_PHASE_RAG)
+        
+        semaphore = asyncio.Semaphore(max(1, self.config.agents.crew.max_concurrency))
+        
+        async def generate(i: int, context: str, docs: list[Document], source_map: dict[str, int]) -> CrewResult:
+            if retrieval_time is not None:
+                trackers[i].metrics[_PHASE_RAG] = retrieval_time
+            async with semaphore:
+                result = await asyncio.to_thread(
+                    self._generate, topics[i], languages[i], context, docs, source_map, trackers[i]
+                )
+            if embeddings is not None:
+                self._remember(embeddings[i], result)
+            return result
+        
+        runs = {}
+        for i, (context, docs, source_map), rejected in zip(pending, retrieved, rejections, strict=True):
+            if rejected is not None:
+                results[i] = rejected
+            else:
+                runs[i] = generate(i, context, docs, source_map)
+        
+        outcomes = await asyncio.gather(*runs.values(), return_exceptions=True)
+        for i, result in zip(runs, outcomes, strict=True):
+            results[i] = result
+        
+        return results
+
+    def _start_tracker(self) -> PerformanceTracker:
+        """
+        Start a fresh tracker for one run.
+        
+        Each run times itself on its own tracker so concurrent runs never
+        overwrite each other's phases; performance_tracker points at the
+        most recently started one.
+        
+        Returns:
+            Started PerformanceTracker
+        """
+        tracker = PerformanceTracker()
+        tracker.start()
+        self.performance_tracker = tracker
+        return tracker
+
+    @cached_property
+    def _embed_topic(self) -> Callable[[str], list[float]]:
+        """Memoized topic embedder (repeated topics skip the encoder pass)."""
+        pipeline = self.rag_pipeline
+
+        @lru_cache(maxsize=256)
+        def embed(topic: str) -> list[float]:
+            return pipeline.embed_query(topic)
+
+        return embed
+
+    def _embed_topics(self, topics: list[str]) -> list[list[float]] | None:
+        """
+        Embed several topics in one encoder pass.
+        
+        Args:
+            topics: Research topics
+            
+        Returns:
+            One embedding per topic, or None if RAG is unavailable or embedding failed
+        """
+        if self.rag_pipeline is None:
+            return None
+        
+        try:
+            return self.rag_pipeline.embed_queries(topics)
+        except Exception as e:
+            logger.warning("Batched topic embedding failed: %s", e)
+            return None
+
+    @cached_property
+    def _search(self) -> Callable[[str, int], tuple[Document, ...]]:
+        """
+        RAG search per (topic, top_k), memoized for rag.retrieval_cache_ttl seconds.
+
+        Off by default: ingestion runs in the gateway process and cannot
+        clear this cache. When enabled, entries are keyed on a TTL time
+        bucket, so newly ingested documents show up for repeated topics
+        within one TTL (or at once after invalidate_retrieval_cache()). Failures and empty results raise
+        instead of returning, so they are never cached.
+        """
+        pipeline = self.rag_pipeline
+        embed = self._embed_topic
+        ttl = self.config.rag.retrieval_cache_ttl
+
+        def search(topic: str, top_k: int) -> tuple[Document, ...]:
+            docs = tuple(pipeline.run(query=topic, top_k=top_k, query_embedding=embed(topic)))
+            if not docs:
+                raise LookupError(topic)
+            return docs
+
+        if ttl <= 0:
+            return search
+
+        @lru_cache(maxsize=256)
+        def cached_search(topic: str, top_k: int, bucket: int) -> tuple[Document, ...]:
+            return search(topic, top_k)
+
+        def memoized(topic: str, top_k: int) -> tuple[Document, ...]:
+            return cached_search(topic, top_k, int(time.monotonic() // ttl))
+
+        memoized.cache_clear = cached_search.cache_clear
+        return memoized
+
+    def invalidate_retrieval_cache(self) -> None:
+        """Forget memoized retrievals, e.g. right after new documents were ingested."""
+        search = self.__dict__.get("_search")
+        if search is not None and hasattr(search, "cache_clear"):
+            search.cache_clear()
+            logger.info("Retrieval cache cleared")
+
+    @contextmanager
+    def _checkout_crew(self) -> Iterator[ResearchCrew]:
+        """
+        Borrow a crew for one run and return it to the pool afterwards.
+        
+        The first crew is the shared ``crew`` instance; further crews are
+        built only when every existing one is busy, up to the pool size.
+        Beyond that, callers wait for a crew to come back.
+        
+        Yields:
+            ResearchCrew reserved for the caller
+        """
+        try:
+            crew = self._idle_crews.get_nowait()
+        except queue.Empty:
+            with self._crew_pool_lock:
+                index = self._crews_built
+                if index < self._crew_pool_size:
+                    self._crews_built += 1
+            
+            if index >= self._crew_pool_size:
+                crew = self._idle_crews.get()
+            else:
+                try:
+                    crew = self.crew if index == 0 else ResearchCrew(self.llm)
+                except Exception:
+                    with self._crew_pool_lock:
+                        self._crews_built -= 1
+                    raise
+                if index > 0:
+                    logger.info("✓ ResearchCrew #%d added to pool", index + 1)
+        
+        try:
+            yield crew
+        finally:
+            self._idle_crews.put(crew)
+
+    def _warm_crew(self) -> None:
+        """Build the crew and its LLM ahead of use so setup overlaps retrieval."""
+        # Not cached on failure; the real access in _generate() re-raises
+        with suppress(RuntimeError):
+            _ = self.crew
+
+    def _lookup_cache(
+        self, topic: str, language: str
+    ) -> tuple[tuple[CrewResult, float] | None, list[float] | None]:
+        """
+        Look up a cached result for a near-duplicate topic.
+        
+        Args:
+            topic: Research topic/question
+            language: Target language
+            
+        Returns:
+            Tuple of (cache hit as (result, similarity) or None, topic embedding
+            or None when the cache is disabled or embedding failed)
+        """
+        if self.semantic_cache is None or self.rag_pipeline is None:
+            return None, None
+        
+        try:
+            query_embedding = self._embed_topic(topic)
+        except Exception as e:
+            logger.warning("Semantic cache lookup skipped: %s", e)
+            return None, None
+        
+        return self.semantic_cache.lookup(query_embedding, language), query_embedding
+
+    def _serve_cached(
+        self, topic: str, cached: CrewResult, similarity: float, tracker: PerformanceTracker
+    ) -> CrewResult:
+        """
+        Turn a semantic cache hit into the result for the current request.
+        
+        Args:
+            topic: Research topic of the current request
+            cached: Cached result for a similar topic
+            similarity: Cosine similarity between the two topics
+            tracker: Performance tracker of the current run
+            
+        Returns:
+            Copy of the cached result carrying this request's topic and timings
+        """
+        tracker.stop()
+        logger.info(
+            "Semantic cache hit (similarity %.3f): reusing result for '%s'",
+            similarity,
+            cached.topic,
+        )
+        return replace(
+            cached,
+            topic=topic,
+            evaluation={
+                # A pending TruLens evaluation belongs to the original request
+                **{k: v for k, v in cached.evaluation.items() if k != "trulens_eval_id"},
+                "performance": tracker.get_summary(),
+                "semantic_cache": {"similarity": similarity, "cached_topic": cached.topic},
+            },
+            generated_at=datetime.now(),
+        )
+
+    def _remember(self, query_embedding: list[float] | None, result: CrewResult) -> None:
+        """
+        Cache a freshly generated result for future near-duplicate topics.
+        
+        Only grounded results that passed the output guardrails are kept.
+        
+        Args:
+            query_embedding: Embedding of the result's topic (None = not cacheable)
+            result: Generated result
+        """
+        if self.semantic_cache is None or query_embedding is None or not result.context_docs:
+            return
+        if not result.evaluation.get("guardrails", {}).get("output_passed", False):
+            return
+        self.semantic_cache.add(query_embedding, result)
+
+    def _check_input(self, topic: str, language: str, tracker: PerformanceTracker) -> CrewResult | None:
+        """
+        Validate the topic with input guardrails.
+        
+        Args:
+            topic: Research topic/question
+            language: Target language
+            tracker: Performance tracker of the current run
+            
+        Returns:
+            None if the topic may proceed, otherwise the rejection CrewResult
+        """
+        if not self._validate_input:
+            return None
+        
+        with tracker.track(_PHASE_GUARD_IN):
+            passed, results = self._validate_input(topic)
+        
+        if passed:
+            return None
+        
+        errors = [r.message for r in results if not r.passed]
+        error_msg = "; ".join(errors)
+        
+        logger.error("Input validation failed: %s", error_msg)
+        tracker.stop()
+        
+        return CrewResult(
+            topic=topic,
+            language=language,
+            final_output=f"⚠️ Safety check failed: {error_msg}",
+            context_docs=[],
+            evaluation={
+                "guardrails": {
+                    "input_passed": False,
+                    "violations": errors,
+                },
+                "performance": tracker.get_summary(),
+            },
+        )
+
+    def _generate(
+        self,
+        topic: str,
+        language: str,
+        context: str,
+        docs: list[Document],
+        source_map: dict[str, int],
+        tracker: PerformanceTracker,
+    ) -> CrewResult:
+        """
+        Run the crew on retrieved context, then validate and evaluate the output.
+        
+        Args:
+            topic: Research topic/question
+            language: Target language
+            context: Formatted RAG context
+            docs: Retrieved documents
+            source_map: Citation numbers for the retrieved sources
+            tracker: Performance tracker of the current run
+            
+        Returns:
+            CrewResult with final output and evaluation metrics
+        """
         if not docs:
             logger.warning(
                 "No documents retrieved for topic '%s'. "
@@ -226,60 +778,56 @@ class CrewRunner:
                 topic
             )
         
-        # Step 2: Execute crew workflow (reuse singleton crew)
-        logger.info("Executing crew workflow (reusing singleton crew)...")
+        # Step 2: Execute crew workflow on a pooled crew
+        logger.info("Executing crew workflow (pooled crew)...")
         
-        with self.performance_tracker.track("crew_execution"):
-            final_output = self.crew.run(topic=topic, context=context, language=language)
+        with self._checkout_crew() as crew, tracker.track(_PHASE_CREW):
+            final_output = crew.run(topic=topic, context=context, language=language)
         
         logger.info("Crew workflow completed. Output length: %d chars", len(final_output))
         
         # Output validation using guardrails
         output_passed = True
-        output_results = []
+        output_warnings = []
         
         if self.output_validator:
-            with self.performance_tracker.track("guardrails_output"):
+            with tracker.track(_PHASE_GUARD_OUT):
                 output_passed, output_results = self.output_validator.validate(final_output)
+                output_warnings = [r.message for r in output_results if not r.passed]
                 
                 if not output_passed:
-                    warnings = [r.message for r in output_results if not r.passed]
-                    logger.warning("Output validation warnings: %s", "; ".join(warnings))
+                    logger.warning("Output validation warnings: %s", "; ".join(output_warnings))
 
-        # Run TruLens evaluation
+        # TruLens evaluation (skipped for outputs the guardrails already flagged)
         evaluation_results = {}
-        record_id = None
         
-        if self.trulens_client:
-            with self.performance_tracker.track("trulens_evaluation"):
-                try:
-                    trulens_result = self.trulens_client.evaluate(
-                        query=topic,
-                        context=context,
-                        answer=final_output,
-                        language=language,
-                    )
+        if self.trulens_client and output_passed:
+            if self.background_evaluation:
+                eval_id = uuid.uuid4().hex
+                future = self._eval_pool.submit(
+                    self._evaluate_trulens, topic, context, final_output, language, tracker
+                )
+                with self._evals_lock:
+                    self._pending_evals[eval_id] = future
+                future.add_done_callback(lambda f, eval_id=eval_id: self._finish_evaluation(eval_id, f))
+                evaluation_results["trulens_eval_id"] = eval_id
+            else:
+                trulens_result = self._evaluate_trulens(topic, context, final_output, language, tracker)
+                if trulens_result is not None:
                     evaluation_results["trulens"] = trulens_result
-                    record_id = trulens_result.get("record_id")
-                    
-                    logger.info(
-                        "TruLens evaluation complete: score=%.2f, record_id=%s",
-                        trulens_result.get("overall_score", 0),
-                        record_id,
-                    )
-                except Exception as e:
-                    logger.warning("TruLens evaluation failed: %s", e)
+        elif self.trulens_client:
+            logger.info("Skipping TruLens evaluation: output failed guardrails")
         
         # Stop performance tracker and get summary
-        self.performance_tracker.stop()
-        perf_summary = self.performance_tracker.get_summary()
+        tracker.stop()
+        perf_summary = tracker.get_summary()
         
         # Compile evaluation results
         evaluation_results["performance"] = perf_summary
         evaluation_results["guardrails"] = {
             "input_passed": True,  # Made it past input validation
             "output_passed": output_passed,
-            "output_warnings": [r.message for r in output_results if not r.passed] if output_results else [],
+            "output_warnings": output_warnings,
         }
         
         logger.info(
@@ -294,42 +842,244 @@ class CrewRunner:
             final_output=final_output,
             context_docs=docs,
             evaluation=evaluation_results,
+            source_map=source_map,
+        )
+
+    def _finish_evaluation(self, eval_id: str, future: Future) -> None:
+        """
+        Move a completed background evaluation from pending to finished.
+        
+        Args:
+            eval_id: Evaluation id handed out in the CrewResult
+            future: Completed evaluation future
+        """
+        result = None if future.cancelled() or future.exception() else future.result()
+        now = time.monotonic()
+        with self._evals_lock:
+            self._pending_evals.pop(eval_id, None)
+            self._finished_evals[eval_id] = (now, result)
+            self._expire_evaluations(now)
+
+    def _expire_evaluations(self, now: float) -> None:
+        """Drop finished evaluations nobody fetched within the TTL (caller holds the lock)."""
+        expired = [
+            eval_id
+            for eval_id, (finished_at, _) in self._finished_evals.items()
+            if now - finished_at > _EVAL_RESULT_TTL_SECONDS
+        ]
+        for eval_id in expired:
+            del self._finished_evals[eval_id]
+
+    def get_evaluation(self, eval_id: str) -> dict[str, Any] | None:
+        """
+        Fetch a background TruLens evaluation once it has finished.
+        
+        A finished evaluation is handed out once and then forgotten; results
+        nobody fetches are dropped after _EVAL_RESULT_TTL_SECONDS.
+        
+        Args:
+            eval_id: The "trulens_eval_id" from a CrewResult's evaluation
+            
+        Returns:
+            TruLens result dict, or None if still running, failed, expired or unknown
+        """
+        with self._evals_lock:
+            self._expire_evaluations(time.monotonic())
+            entry = self._finished_evals.pop(eval_id, None)
+        return None if entry is None else entry[1]
+
+    def _evaluate_trulens(
+        self, topic: str, context: str, final_output: str, language: str, tracker: PerformanceTracker
+    ) -> dict[str, Any] | None:
+        """
+        Run TruLens evaluation for a completed crew output.
+        
+        Args:
+            topic: Research topic
+            context: Formatted RAG context
+            final_output: Generated summary
+            language: Target language
+            tracker: Performance tracker of the run being evaluated
+            
+        Returns:
+            TruLens result dictionary, or None if evaluation failed
+        """
+        with tracker.track(_PHASE_TRULENS):
+            try:
+                trulens_result = self.trulens_client.evaluate(
+                    query=topic,
+                    context=context,
+                    answer=final_output,
+                    language=language,
+                )
+            except Exception as e:
+                logger.warning("TruLens evaluation failed: %s", e)
+                return None
+        
+        logger.info(
+            "TruLens evaluation complete: score=%.2f, record_id=%s",
+            trulens_result.get("overall_score", 0),
+            trulens_result.get("record_id"),
         )
+        return trulens_result
 
-    def retrieve_context(self, topic: str) -> tuple[str, List[Document]]:
+    def retrieve_context(
+        self, topic: str, tracker: PerformanceTracker | None = None
+    ) -> tuple[str, list[Document], dict[str, int]]:
         """
         Retrieve relevant context from RAG pipeline.
         
+        If rag.retrieval_cache_ttl is set, results are memoized per
+        (topic, top_k) for that many seconds, so re-runs of a topic skip
+        the vector search. The topic embedding is shared with the
+        semantic cache lookup.
+        
         Args:
             topic: Research topic
+            tracker: Tracker to time retrieval on (default: performance_tracker)
             
         Returns:
-            Tuple of (formatted_context, documents)
+            Tuple of (formatted_context, documents, source_map)
         """
         if self.rag_pipeline is None:
             logger.warning("RAG pipeline not initialized. No context available.")
-            return "NO CONTEXT AVAILABLE: RAG pipeline not initialized.", []
+            return "NO CONTEXT AVAILABLE: RAG pipeline not initialized.", [], {}
+        
+        if tracker is None:
+            tracker = self.performance_tracker
         
         try:
-            with self.performance_tracker.track("rag_retrieval"):
+            with tracker.track(_PHASE_RAG):
                 top_k = self.config.rag.top_k
                 logger.info("Retrieving top-%d documents for topic: %s", top_k, topic)
                 
-                docs = self.rag_pipeline.run(query=topic, top_k=top_k)
+                try:
+                    docs = list(self._search(topic, top_k))
+                except LookupError:
+                    docs = []
                 
                 logger.info("Retrieved %d documents from RAG", len(docs))
                 
-                context = self._format_context(docs)
-                
-                return context, docs
+                return self._build_context(docs)
                 
         except Exception as e:
             logger.exception("RAG retrieval failed: %s", e)
-            return f"CONTEXT UNAVAILABLE: Error during retrieval: {e}", []
+            return f"CONTEXT UNAVAILABLE: Error during retrieval: {e}", [], {}
 
-    def _format_context(self, documents: List[Document]) -> str:
+    def retrieve_context_batch(
+        self,
+        topics: list[str],
+        tracker: PerformanceTracker | None = None,
+        query_embeddings: list[list[float]] | None = None,
+    ) -> list[tuple[str, list[Document], dict[str, int]]]:
         """
-        Format retrieved documents with citation markers.
+        Retrieve context for several topics with one batched RAG call.
+        
+        Query embedding happens in a single encoder pass, so queued topics
+        share the embedding cost instead of paying it one by one.
+        
+        Args:
+            topics: Research topics
+            tracker: Tracker to time retrieval on (default: performance_tracker)
+            query_embeddings: Embeddings of ``topics`` if already computed
+            
+        Returns:
+            One (formatted_context, documents, source_map) tuple per topic, in order
+        """
+        if self.rag_pipeline is None:
+            logger.warning("RAG pipeline not initialized. No context available.")
+            return [("NO CONTEXT AVAILABLE: RAG pipeline not initialized.", [], {}) for _ in topics]
+        
+        if tracker is None:
+            tracker = self.performance_tracker
+        
+        try:
+            with tracker.track(_PHASE_RAG):
+                top_k = self.config.rag.top_k
+                logger.info("Retrieving top-%d documents for %d topics", top_k, len(topics))
+                
+                batches = self.rag_pipeline.run_batch(
+                    queries=topics, top_k=top_k, query_embeddings=query_embeddings
+                )
+                
+                return [self._build_context(docs) for docs in batches]
+                
+        except Exception as e:
+            logger.exception("Batched RAG retrieval failed: %s", e)
+            return [(f"CONTEXT UNAVAILABLE: Error during retrieval: {e}", [], {}) for _ in topics]
+
+    def _build_context(self, documents: list[Document]) -> tuple[str, list[Document], dict[str, int]]:
+        """
+        Trim retrieved documents to the context budget and format them.
+        
+        Args:
+            documents: Documents returned by the RAG pipeline
+            
+        Returns:
+            Tuple of (formatted_context, documents, source_map)
+        """
+        # Drop repeated chunks, then only keep what fits the agents' context budget
+        docs = list(self._iter_within_budget(self._dedupe_documents(documents)))
+        source_map = self._index_sources(docs)
+        return self._format_context(docs, source_map), docs, source_map
+
+    @staticmethod
+    def _dedupe_documents(documents: list[Document]) -> list[Document]:
+        """
+        Drop documents whose text repeats an earlier one.
+        
+        The same chunk can come back more than once (e.g. a paper ingested
+        from two sources); every repeat only adds prompt tokens.
+        
+        Args:
+            documents: Retrieved documents in relevance order
+            
+        Returns:
+            Documents with unique content, first occurrence kept
+        """
+        seen: set[str] = set()
+        unique = []
+        for doc in documents:
+            content = doc.content.strip()
+            if content in seen:
+                continue
+            seen.add(content)
+            unique.append(doc)
+        
+        if len(unique) < len(documents):
+            logger.info("Dropped %d duplicate chunks from context", len(documents) - len(unique))
+        return unique
+
+    def _iter_within_budget(self, documents: list[Document]) -> Iterator[Document]:
+        """
+        Yield documents until the context character budget is used up.
+        
+        The document that crosses the budget is still included, so at least
+        one document is always kept.
+        
+        Args:
+            documents: Retrieved documents in relevance order
+            
+        Yields:
+            Documents that fit within max_context_chars
+        """
+        running = 0
+        for kept, doc in enumerate(documents, 1):
+            yield doc
+            running += len(doc.content)
+            if running >= self.max_context_chars:
+                if kept < len(documents):
+                    logger.info(
+                        "Context budget of %d chars reached; dropping %d documents",
+                        self.max_context_chars,
+                        len(documents) - kept,
+                    )
+                break
+
+    @staticmethod
+    def _index_sources(documents: list[Document]) -> dict[str, int]:
+        """
+        Assign citation numbers to sources in order of first appearance.
         
         Deduplicates sources so multiple chunks from the same document
         share the same citation number.
@@ -337,87 +1087,101 @@ class CrewRunner:
         Args:
             documents: Retrieved documents
             
+        Returns:
+            Dictionary mapping source name to citation number
+        """
+        source_map = {}
+        for doc in documents:
+            source_map.setdefault(doc.meta.get("source", "unknown"), len(source_map) + 1)
+        return source_map
+
+    def _format_context(self, documents: list[Document], source_map: dict[str, int]) -> str:
+        """
+        Format retrieved documents with citation markers.
+        
+        Args:
+            documents: Retrieved documents
+            source_map: Citation numbers from _index_sources()
+            
         Returns:
             Formatted context string with [1], [2], etc. markers
         """
         if not documents:
             return "NO CONTEXT AVAILABLE"
         
-        # Deduplicate sources (multiple chunks from same source get same citation)
-        source_map = {}
-        source_counter = 1
-        
-        for doc in documents:
-            source = doc.meta.get("source", "unknown")
-            if source not in source_map:
-                source_map[source] = source_counter
-                source_counter += 1
-        
-        # Format chunks with citations
-        formatted_chunks = []
+        # Format each chunk with its citation from the prebuilt template
+        chunks = []
         for doc in documents:
-            source = doc.meta.get("source", "unknown")
-            citation_num = source_map[source]
+            meta = doc.meta
+            source = meta.get("source", "unknown")
             
             # Add metadata if available
             metadata_parts = []
-            if "title" in doc.meta:
-                metadata_parts.append(doc.meta["title"])
-            if "authors" in doc.meta:
-                metadata_parts.append(f"Authors: {doc.meta['authors']}")
-            if "year" in doc.meta:
-                metadata_parts.append(f"Year: {doc.meta['year']}")
+            if "title" in meta:
+                metadata_parts.append(meta["title"])
+            if "authors" in meta:
+                metadata_parts.append(f"Authors: {meta['authors']}")
+            if "year" in meta:
+                metadata_parts.append(f"Year: {meta['year']}")
+            metaline = ""
+            if metadata_parts:
+                # Kept on one line so the factchecker can read it back from the header
+                metaline = _META_TMPL.format_map({"meta": " ".join(", ".join(metadata_parts).split())})
             
-            metadata_line = f"METADATA: {', '.join(metadata_parts)}" if metadata_parts else ""
-            
-            chunk_text = f"SOURCE [{citation_num}]: {source}\n"
-            if metadata_line:
-                chunk_text += f"{metadata_line}\n"
-            chunk_text += f"{doc.content.strip()}\n"
-            
-            formatted_chunks.append(chunk_text)
-        
-        context = "\n---\n".join(formatted_chunks)
+            chunks.append(_CHUNK_TMPL.format_map({
+                "n": source_map[source],
+                "src": source,
+                "metaline": metaline,
+                "body": doc.content.strip(),
+            }))
         
-        # Add source summary at end
-        context += "\n\n=== SOURCES ===\n"
-        for source, num in sorted(source_map.items(), key=lambda x: x[1]):
-            context += f"[{num}] {source}\n"
+        # Join chunks, then add source summary at end
+        parts = ["\n---\n".join(chunks), "\n\n=== SOURCES ===\n"]
+        parts.extend(f"[{num}] {source}\n" for source, num in source_map.items())
         
-        return context
+        return "".join(parts)
 
-    def save_output(self, result: CrewResult, output_base_dir: Path = None) -> dict[str, Path]:
+    def save_output(self, result: CrewResult, output_base_dir: Path | None = None) -> dict[str, Path]:
         """
         Save crew output to multiple formats.
         
         Args:
             result: CrewResult to save
-            output_base_dir: Base directory for outputs
+            output_base_dir: Base directory for outputs (default: configured output_dir)
             
         Returns:
             Dictionary mapping format names to file paths
         """
         if output_base_dir is None:
-            output_base_dir = Path("outputs")
+            output_base_dir = self.output_base_dir
+        
+        # Base directory rarely changes: create it (and its parents) only once
+        if output_base_dir not in self._ensured_output_dirs:
+            output_base_dir.mkdir(parents=True, exist_ok=True)
+            self._ensured_output_dirs.add(output_base_dir)
         
         # Create folder with timestamp and topic slug
         topic_slug = self._slugify_topic(result.topic)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = result.generated_at.strftime("%Y%m%d_%H%M%S")
         folder_name = f"{timestamp}_{topic_slug}"
         output_dir = output_base_dir / folder_name
-        output_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            output_dir.mkdir(exist_ok=True)
+        except FileNotFoundError:
+            # Base directory was removed while the runner was alive
+            output_dir.mkdir(parents=True, exist_ok=True)
         
         saved_paths = {}
         
         # Save as markdown
         md_path = output_dir / "summary.md"
         md_content = self._format_markdown_output(result)
-        md_path.write_text(md_content, encoding="utf-8")
+        md_path.write_bytes(md_content.encode("utf-8"))
         saved_paths["markdown"] = md_path
         
         # Save as plain text
         txt_path = output_dir / "summary.txt"
-        txt_path.write_text(result.final_output, encoding="utf-8")
+        txt_path.write_bytes(result.final_output.encode("utf-8"))
         saved_paths["text"] = txt_path
         
         logger.info("Outputs saved to: %s", output_dir)
@@ -433,13 +1197,21 @@ class CrewRunner:
         Returns:
             Filesystem-safe slug (max 50 chars)
         """
-        # Remove non-alphanumeric characters
-        slug = re.sub(r'[^\w\s-]', '', topic.lower())
-        # Replace whitespace/underscores with single underscore
-        slug = re.sub(r'[\s_]+', '_', slug)
-        # Limit length
-        slug = slug[:50]
-        return slug
+        # Single pass: keep alphanumerics and hyphens, collapse runs of
+        # whitespace/underscores into one underscore, drop everything else
+        out = []
+        prev_sep = False
+        for char in topic.lower():
+            if char.isalnum() or char == "-":
+                out.append(char)
+                prev_sep = False
+            elif (char.isspace() or char == "_") and not prev_sep:
+                out.append("_")
+                prev_sep = True
+            # Limit length
+            if len(out) == _SLUG_MAX_LEN:
+                break
+        return "".join(out)
 
     def _format_markdown_output(self, result: CrewResult) -> str:
         """
@@ -451,83 +1223,120 @@ class CrewRunner:
         Returns:
             Markdown-formatted string
         """
-        md = f"# Research Summary: {result.topic}\n\n"
-        md += f"**Language:** {result.language}\n"
-        md += f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
-        md += f"**Sources:** {len(result.context_docs)} documents\n\n"
-        md += "---\n\n"
+        buf = [_MD_HEADER_TMPL.format_map({
+            "topic": result.topic,
+            "language": result.language,
+            "generated": result.generated_at.strftime("%Y-%m-%d %H:%M:%S"),
+            "count": len(result.context_docs),
+        })]
         
         # Main output
-        md += result.final_output
+        buf.append(result.final_output)
         
         # Add sources section
-        md += "\n\n---\n\n"
-        md += "## Sources\n\n"
+        buf.append("\n\n---\n\n")
+        buf.append("## Sources\n\n")
         
-        sources = set()
-        for doc in result.context_docs:
-            source = doc.meta.get("source", "unknown")
-            sources.add(source)
+        # Reuse the citation numbering from retrieval so the list matches [n]
+        source_map = result.source_map
+        if source_map is None:
+            source_map = self._index_sources(result.context_docs)
         
-        for i, source in enumerate(sorted(sources), 1):
-            md += f"{i}. {source}\n"
+        for source, num in source_map.items():
+            buf.append(f"{num}. {source}\n")
         
         # Add evaluation summary
         if result.evaluation:
-            md += "\n\n## Evaluation Metrics\n\n"
+            buf.append("\n\n## Evaluation Metrics\n\n")
             
             if "performance" in result.evaluation:
                 perf = result.evaluation["performance"]
-                md += "### Performance\n"
-                md += f"- Total Time: {perf.get('total_time', 0):.2f}s\n"
-                if "components" in perf:
-                    for comp, time in perf["components"].items():
-                        if comp != "total_time":
-                            md += f"- {comp}: {time:.2f}s\n"
-                md += "\n"
+                buf.append("### Performance\n")
+                buf.append(f"- Total Time: {perf.get('total_time', 0):.2f}s\n")
+                for comp, seconds in perf.get("components", {}).items():
+                    if comp != "total_time":
+                        buf.append(f"- {comp}: {seconds:.2f}s\n")
+                buf.append("\n")
             
             if "trulens" in result.evaluation:
                 trulens = result.evaluation["trulens"]
-                md += "### Quality Metrics (TruLens)\n"
+                buf.append("### Quality Metrics (TruLens)\n")
                 if "overall_score" in trulens:
-                    md += f"- Overall Score: {trulens['overall_score']:.2f}\n"
+                    buf.append(f"- Overall Score: {trulens['overall_score']:.2f}\n")
                 if "trulens" in trulens and isinstance(trulens["trulens"], dict):
                     for metric, value in trulens["trulens"].items():
                         if isinstance(value, (int, float)):
-                            md += f"- {metric}: {value:.2f}\n"
-                md += "\n"
+                            buf.append(f"- {metric}: {value:.2f}\n")
+                buf.append("\n")
             
             if "guardrails" in result.evaluation:
                 guards = result.evaluation["guardrails"]
-                md += "### Safety Validation (Guardrails)\n"
-                md += f"- Input Passed: {'✅' if guards.get('input_passed') else '❌'}\n"
-                md += f"- Output Passed: {'✅' if guards.get('output_passed') else '❌'}\n"
+                buf.append("### Safety Validation (Guardrails)\n")
+                buf.append(f"- Input Passed: {'✅' if guards.get('input_passed') else '❌'}\n")
+                buf.append(f"- Output Passed: {'✅' if guards.get('output_passed') else '❌'}\n")
                 if guards.get("output_warnings"):
-                    md += "\nWarnings:\n"
+                    buf.append("\nWarnings:\n")
                     for warning in guards["output_warnings"]:
-                        md += f"- {warning}\n"
+                        buf.append(f"- {warning}\n")
         
-        return md
+        return "".join(buf)
 
 
 # ============================================================================
 # Crew Runner - Singleton Instance
 # ============================================================================
 
-_crew_runner = None
+_crew_runner_lock = threading.Lock()
 
+# Shared runners, one per (guardrails, monitoring, background_evaluation, semantic_cache)
+_crew_runners: dict[tuple[bool, bool, bool, bool | None], CrewRunner] = {}
 
-def get_crew_runner() -> CrewRunner:
+
+def get_crew_runner(
+    enable_guardrails: bool = True,
+    enable_monitoring: bool = True,
+    background_evaluation: bool = False,
+    semantic_cache: bool | None = None,
+) -> CrewRunner:
     """
-    Get singleton CrewRunner instance.
+    Get the shared CrewRunner for a configuration.
+    
+    One instance is built per distinct set of arguments and reused by all
+    later calls; the defaults are the API service's configuration.
+    Thread-safe: concurrent first calls (router import, job manager, worker
+    threads) all receive the same instance.
+    
+    Args:
+        enable_guardrails: Enable safety checks on inputs/outputs
+        enable_monitoring: Enable TruLens monitoring
+        background_evaluation: Run TruLens evaluation in the background
+        semantic_cache: Serve cached results for near-duplicate topics
+            (None = use agents.crew.semantic_cache from config)
     
     Returns:
-        Global CrewRunner instance
+        Shared CrewRunner instance
     """
-    global _crew_runner
-    if _crew_runner is None:
-        _crew_runner = CrewRunner(
-            enable_guardrails=True,
-            enable_monitoring=True,
-        )
-    return _crew_runner
\ No newline at end of file
+    key = (enable_guardrails, enable_monitoring, background_evaluation, semantic_cache)
+    with _crew_runner_lock:
+        runner = _crew_runners.get(key)
+        if runner is None:
+            runner = _crew_runners[key] = CrewRunner(
+                enable_guardrails=enable_guardrails,
+                enable_monitoring=enable_monitoring,
+                background_evaluation=background_evaluation,
+                semantic_cache=semantic_cache,
+            )
+        return runner
+
+
+def close_crew_runners() -> None:
+    """
+    Close every shared CrewRunner and forget them.
+    
+    Later get_crew_runner() calls build fresh instances. Runners that were
+    never requested are not created.
+    """
+    with _crew_runner_lock:
+        for runner in _crew_runners.values():
+            runner.close()
+        _crew_runners.clear()
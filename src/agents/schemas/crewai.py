@@ -11,7 +11,24 @@ from __future__ import annotations
 
 from typing import Any, Dict, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+# Supported target languages (ISO 639-1), built once for O(1) membership checks
+_SUPPORTED_LANGUAGES: frozenset[str] = frozenset({
+    'en',  # English
+    'de',  # German
+    'fr',  # French
+    'es',  # Spanish
+    'it',  # Italian
+    'pt',  # Portuguese
+    'nl',  # Dutch
+    'pl',  # Polish
+    'ru',  # Russian
+    'ja',  # Japanese
+    'zh',  # Chinese
+    'ko',  # Korean
+})
+_SUPPORTED_LANGUAGES_TEXT = ", ".join(sorted(_SUPPORTED_LANGUAGES))
 
 
 class CrewRunRequest(BaseModel):
@@ -23,6 +40,9 @@ class CrewRunRequest(BaseModel):
         language: Target language code
     """
     
+    # Whitespace is stripped by pydantic-core before length checks
+    model_config = ConfigDict(frozen=True, str_strip_whitespace=True)
+    
     topic: str = Field(
         ..., 
         description="Research topic or question",
@@ -37,9 +57,7 @@ class CrewRunRequest(BaseModel):
     @field_validator('topic')
     @classmethod
     def validate_topic(cls, v: str) -> str:
-        """Validate topic string."""
-        v = v.strip()
-        
+        """Validate topic string (already stripped)."""
         # Check for invalid topics
         if v == "=" or v == "":
             raise ValueError('Topic cannot be empty or just special characters')
@@ -54,26 +72,11 @@ class CrewRunRequest(BaseModel):
     @classmethod
     def validate_language(cls, v: str) -> str:
         """Validate language code."""
-        supported = [
-            'en',  # English
-            'de',  # German
-            'fr',  # French
-            'es',  # Spanish
-            'it',  # Italian
-            'pt',  # Portuguese
-            'nl',  # Dutch
-            'pl',  # Polish
-            'ru',  # Russian
-            'ja',  # Japanese
-            'zh',  # Chinese
-            'ko',  # Korean
-        ]
-       
         v_lower = v.lower()
        
-        if v_lower not in supported:
+        if v_lower not in _SUPPORTED_LANGUAGES:
             raise ValueError(
-                f'Language {v} not supported. Supported: {supported}'
+                f'Language {v} not supported. Supported: {_SUPPORTED_LANGUAGES_TEXT}'
             )
        
         return v_lower
@@ -90,6 +93,8 @@ class CrewRunResponse(BaseModel):
         evaluation: Evaluation metrics
     """
     
+    model_config = ConfigDict(frozen=True)
+    
     topic: str = Field(..., description="Original research topic")
     language: str = Field(..., description="Language code")
     answer: str = Field(..., description="Generated research summary")
@@ -115,6 +120,8 @@ class CrewAsyncRunResponse(BaseModel):
         message: Human-readable message
     """
     
+    model_config = ConfigDict(frozen=True)
+    
     job_id: str = Field(..., description="Job ID for tracking execution")
     status: str = Field(..., description="Initial status (always 'pending')")
     message: str = Field(..., description="Human-readable message")
@@ -138,6 +145,8 @@ class CrewStatusResponse(BaseModel):
         evaluation: Evaluation metrics (if completed)
     """
     
+    model_config = ConfigDict(frozen=True)
+    
     job_id: str = Field(..., description="Job identifier")
     status: str = Field(
         ..., 
@@ -8,23 +8,13 @@ Architecture:
 """
 from __future__ import annotations
 
+import re
+
 from crewai import Task
 
 
-def create_factchecker_task(agent, reviewer_task, context: str) -> Task:
-    """
-    Create fact-checking task with strict output rules.
-    
-    Args:
-        agent: FactChecker agent instance
-        reviewer_task: Completed reviewer task (provides text to check)
-        context: Original retrieved context for verification
-        
-    Returns:
-        Configured Task instance
-    """
-
-    description = f"""
+# Constant prompt text, built once; only the sources are filled in per task
+_DESCRIPTION_TEMPLATE = """
         
 TASK: VERIFY every claim in the text matches text against sources. 
 REMOVE unsupported claims. ADD References section.
@@ -65,8 +55,18 @@ OUTPUT STRUCTURE:
 [3] Third source in APA7 format.
 
 """
-    
-    expected_output = f"""
+
+# Split around the sources slot so each task is a single join
+_DESCRIPTION_PREFIX, _DESCRIPTION_SUFFIX = _DESCRIPTION_TEMPLATE.split("{context}")
+
+# Chunk headers written by CrewRunner._format_context (ResearchCrew._summarize_sources
+# rewrites them, so they are read from the raw context):
+# "SOURCE [n]: <source>" optionally followed by "METADATA: <title, authors, year>"
+_SOURCE_HEADER_RE = re.compile(r"^SOURCE \[(\d+)\]: (.*)\nMETADATA: (.*)$", re.MULTILINE)
+
+_REFERENCE_DATA_HEADER = "\n\nREFERENCE DATA (use for the References section):\n"
+
+_EXPECTED_OUTPUT = """
         
 Fact-checked text with verified claims. 
 All claims verified against sources.
@@ -74,12 +74,58 @@ MUST include ## References section with APA7 citations.
 Format: Summary text, then blank line, then ## References, then list of sources.
 
 """
+
+
+def _reference_data(source_context: str, context: str) -> str:
+    """
+    Collect per-source metadata from the raw context's chunk headers.
+    
+    Lets the model copy authors, titles and years into the References
+    section instead of searching the whole context for them.
+    
+    Args:
+        source_context: Raw RAG context as written by CrewRunner._format_context
+        context: Sources given to the factchecker; only sources shown there are listed
+        
+    Returns:
+        One "[n] source - metadata" line per source with metadata, or "" if none
+    """
+    lines = {}
+    for match in _SOURCE_HEADER_RE.finditer(source_context):
+        num, source, metadata = match.groups()
+        if f"SOURCE [{num}]" in context:
+            lines.setdefault(int(num), f"[{num}] {source} - {metadata}")
+    return "\n".join(lines[num] for num in sorted(lines))
+
+
+def create_factchecker_task(agent, reviewer_task, context: str, source_context: str | None = None) -> Task:
+    """
+    Create fact-checking task with strict output rules.
+    
+    Args:
+        agent: FactChecker agent instance
+        reviewer_task: Completed reviewer task (provides text to check)
+        context: Original retrieved context for verification
+        source_context: Unsummarized RAG context whose chunk headers hold the
+            reference metadata (default: context)
+        
+    Returns:
+        Configured Task instance
+    """
+
+    reference_data = _reference_data(source_context if source_context is not None else context, context)
+    if reference_data:
+        description = "".join(
+            (_DESCRIPTION_PREFIX, context, _REFERENCE_DATA_HEADER, reference_data, _DESCRIPTION_SUFFIX)
+        )
+    else:
+        description = "".join((_DESCRIPTION_PREFIX, context, _DESCRIPTION_SUFFIX))
     
     context = [reviewer_task]
 
     return Task(
         description=description,
-        expected_output=expected_output,
+        expected_output=_EXPECTED_OUTPUT,
         agent=agent,
         context=context
     )
\ No newline at end of file
@@ -11,19 +11,8 @@ from __future__ import annotations
 from crewai import Task
 
 
-def create_reviewer_task(agent, writer_task) -> Task:
-    """
-    Create reviewer task.
-    
-    Args:
-        agent: Reviewer agent instance
-        writer_task: Completed writer task (provides context)
-        
-    Returns:
-        Configured Task instance
-    """
-
-    description = f"""
+# Constant prompt text, built once at import
+_DESCRIPTION = """
 
 TASK: REVIEW and IMPROVE the draft text.
 
@@ -56,19 +45,32 @@ REMOVE: Any LaTeX notation (\\(x\\), $t$, etc.)
 OUTPUT: The improved text ONLY, without any commentary about the text.
 
 """
-    
-    expected_output = f"""
+
+_EXPECTED_OUTPUT = """
 
 Improved draft with enhanced clarity and polished academic style. 
 All original citations preserved. No LaTeX notation. NO meta-commentary.
 
 """
+
+
+def create_reviewer_task(agent, writer_task) -> Task:
+    """
+    Create reviewer task.
     
+    Args:
+        agent: Reviewer agent instance
+        writer_task: Completed writer task (provides context)
+        
+    Returns:
+        Configured Task instance
+    """
+
     context = [writer_task]
 
     return Task(
-        description=description,
-        expected_output=expected_output,
+        description=_DESCRIPTION,
+        expected_output=_EXPECTED_OUTPUT,
         agent=agent,
         context=context
     )
\ No newline at end of file
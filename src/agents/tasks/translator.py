@@ -12,6 +12,36 @@ from __future__ import annotations
 from crewai import Task
 
 
+# Lookup tables, built once at import
+_LANGUAGE_NAMES = {
+    'de': 'German',
+    'fr': 'French',
+    'es': 'Spanish',
+    'it': 'Italian',
+    'pt': 'Portuguese',
+    'nl': 'Dutch',
+    'pl': 'Polish',
+    'ru': 'Russian',
+    'ja': 'Japanese',
+    'zh': 'Chinese',
+    'ko': 'Korean',
+}
+
+_REFERENCE_HEADERS = {
+    'de': 'Literaturverzeichnis',
+    'fr': 'Références',
+    'es': 'Referencias',
+    'it': 'Riferimenti',
+    'pt': 'Referências',
+    'nl': 'Referenties',
+    'pl': 'Bibliografia',
+    'ru': 'Список литературы',
+    'ja': '参考文献',
+    'zh': '参考文献',
+    'ko': '참고문헌',
+}
+
+
 def create_translator_task(agent, factchecker_task: Task, target_language: str) -> Task:
     """
     Create translator task with language-specific instructions.
@@ -25,36 +55,8 @@ def create_translator_task(agent, factchecker_task: Task, target_language: str)
         Configured Task instance
     """
     
-    language_names = {
-        'de': 'German',
-        'fr': 'French',
-        'es': 'Spanish',
-        'it': 'Italian',
-        'pt': 'Portuguese',
-        'nl': 'Dutch',
-        'pl': 'Polish',
-        'ru': 'Russian',
-        'ja': 'Japanese',
-        'zh': 'Chinese',
-        'ko': 'Korean',
-    }
-   
-    reference_headers = {
-        'de': 'Literaturverzeichnis',
-        'fr': 'Références',
-        'es': 'Referencias',
-        'it': 'Riferimenti',
-        'pt': 'Referências',
-        'nl': 'Referenties',
-        'pl': 'Bibliografia',
-        'ru': 'Список литературы',
-        'ja': '参考文献',
-        'zh': '参考文献',
-        'ko': '참고문헌',
-    }
-   
-    language = language_names.get(target_language.lower(), target_language)
-    reference_header = reference_headers.get(target_language.lower(), 'References')
+    language = _LANGUAGE_NAMES.get(target_language.lower(), target_language)
+    reference_header = _REFERENCE_HEADERS.get(target_language.lower(), 'References')
    
     description = f"""
     
@@ -12,6 +12,22 @@ from __future__ import annotations
 from crewai import Task
 
 
+# Constant expected outputs per mode, built once at import
+_EXPECTED_OUTPUT_DEFAULT = """
+        
+A well-structured summary of 200-300 words
+that accurately reflects the information from the sources 
+and includes proper in-text citations ([1], [2], etc.).
+        
+"""
+
+_EXPECTED_OUTPUT_FALLBACK = """
+        
+A clear and concise, 200-300 words, educational summary without citations.
+        
+"""
+
+
 def create_writer_task(agent, topic: str, context: str, mode: str = "default") -> Task:
     """
     Create writer task with mode-specific instructions.
@@ -45,13 +61,7 @@ REQUIREMENTS:
 
 """
 
-        expected_output = f"""
-        
-A well-structured summary of 200–300 words
-that accurately reflects the information from the sources 
-and includes proper in-text citations ([1], [2], etc.).
-        
-"""
+        expected_output = _EXPECTED_OUTPUT_DEFAULT
 
     else:
 
@@ -71,11 +81,7 @@ REQUIREMENTS:
 
 """
 
-        expected_output = f"""
-        
-A clear and concise, 200-300 words, educational summary without citations.
-        
-"""
+        expected_output = _EXPECTED_OUTPUT_FALLBACK
     
     return Task(
         description=description,
@@ -5,6 +5,7 @@ Configure validation rules and thresholds.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cache
 from typing import List, Optional
 
 
@@ -64,8 +65,9 @@ class GuardrailsConfig:
             ]
 
 
+@cache
 def load_guardrails_config() -> GuardrailsConfig:
-    """Load guardrails config from environment/config file."""
+    """Load guardrails config from environment/config file (loaded once, shared read-only)."""
     # For now, use defaults
     # TODO: Load from env vars or YAML
     return GuardrailsConfig()
\ No newline at end of file
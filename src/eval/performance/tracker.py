@@ -5,13 +5,19 @@ Decorators and context managers for tracking execution time.
 from __future__ import annotations
 
 import logging
+import os
 import time
-from contextlib import contextmanager
+from contextlib import AbstractContextManager, contextmanager, nullcontext
 from functools import wraps
 from typing import Any, Callable, Dict, Generator, Optional
 
 logger = logging.getLogger(__name__)
 
+_NS_PER_SECOND = 1_000_000_000
+
+# Shared no-op returned by track() when tracking is disabled
+_NO_TRACKING = nullcontext()
+
 
 class PerformanceTracker:
     """
@@ -27,30 +33,34 @@ class PerformanceTracker:
             # ... writer agent code ...
         
         metrics = tracker.get_metrics()
+    
+    Timings use the monotonic nanosecond clock (time.perf_counter_ns) and
+    are converted to seconds once per span. Set PERF_TRACK=0 to turn
+    track() into a no-op on production hot paths.
     """
 
     def __init__(self):
         """Initialize tracker."""
         self.metrics: Dict[str, float] = {}
-        self.start_time: Optional[float] = None
-        self.end_time: Optional[float] = None
-        self._active_timers: Dict[str, float] = {}
+        self.start_time: Optional[int] = None
+        self.end_time: Optional[int] = None
+        self._active_timers: Dict[str, int] = {}
+        self.enabled = os.environ.get("PERF_TRACK", "1") != "0"
 
     def start(self):
         """Start overall timer."""
-        self.start_time = time.time()
+        self.start_time = time.perf_counter_ns()
         logger.debug("Performance tracking started")
 
     def stop(self):
         """Stop overall timer."""
-        self.end_time = time.time()
+        self.end_time = time.perf_counter_ns()
         if self.start_time:
-            total_time = self.end_time - self.start_time
+            total_time = (self.end_time - self.start_time) / _NS_PER_SECOND
             self.metrics["total_time"] = total_time
             logger.info("Performance tracking stopped. Total time: %.2fs", total_time)
 
-    @contextmanager
-    def track(self, name: str) -> Generator[None, None, None]:
+    def track(self, name: str) -> AbstractContextManager[None]:
         """
         Context manager to track execution time of a code block.
         
@@ -61,14 +71,21 @@ class PerformanceTracker:
             with tracker.track("operation_name"):
                 # ... code to track ...
         """
-        start = time.time()
+        if not self.enabled:
+            return _NO_TRACKING
+        return self._track(name)
+
+    @contextmanager
+    def _track(self, name: str) -> Generator[None, None, None]:
+        """Time a block and record it under ``name`` (see track())."""
+        start = time.perf_counter_ns()
         self._active_timers[name] = start
         logger.debug("Started tracking: %s", name)
         
         try:
             yield
         finally:
-            elapsed = time.time() - start
+            elapsed = (time.perf_counter_ns() - start) / _NS_PER_SECOND
             self.metrics[name] = elapsed
             del self._active_timers[name]
             logger.debug("Finished tracking %s: %.2fs", name, elapsed)
@@ -131,14 +148,14 @@ def track_performance(name: str) -> Callable:
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args, **kwargs):
-            start = time.time()
+            start = time.perf_counter_ns()
             logger.debug("Performance tracking started: %s", name)
             
             try:
                 result = func(*args, **kwargs)
                 return result
             finally:
-                elapsed = time.time() - start
+                elapsed = (time.perf_counter_ns() - start) / _NS_PER_SECOND
                 logger.info("Performance: %s completed in %.2fs", name, elapsed)
         
         return wrapper
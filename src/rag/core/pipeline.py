@@ -16,9 +16,11 @@ import logging
 import re
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional
 
-from haystack.components.embedders import SentenceTransformersTextEmbedder
+from haystack.components.embedders import (
+    SentenceTransformersDocumentEmbedder,
+    SentenceTransformersTextEmbedder,
+)
 from haystack.dataclasses import Document
 
 from ...utils.config import load_config
@@ -41,12 +43,14 @@ class RAGPipeline:
         client: Weaviate client instance
         retriever: Weaviate retriever (legacy, not currently used)
         text_embedder: SentenceTransformers embedder for query embedding
+        batch_embedder: Embedder for batched queries (shares the text embedder's model)
         collection_name: Weaviate collection name (default: "ResearchDocument")
     """
 
     client: any
     retriever: any
     text_embedder: SentenceTransformersTextEmbedder
+    batch_embedder: SentenceTransformersDocumentEmbedder
     collection_name: str
 
     def __enter__(self):
@@ -157,7 +161,8 @@ class RAGPipeline:
                 from .schema import SchemaManager
                 schema_manager = SchemaManager(
                     client=client,
-                    allow_reset=False
+                    allow_reset=False,
+                    vector_quantization=cfg.weaviate.vector_quantization,
                 )
                 schema_manager.ensure_schema()
 
@@ -170,12 +175,17 @@ class RAGPipeline:
             text_embedder = SentenceTransformersTextEmbedder(model=embedding_model)
             text_embedder.warm_up()
 
+            # Same model, so warm_up() reuses the backend loaded above
+            batch_embedder = SentenceTransformersDocumentEmbedder(model=embedding_model, progress_bar=False)
+            batch_embedder.warm_up()
+
             logger.info("RAGPipeline connected to existing index (collection: %s)", collection_name)
 
             return cls(
                 client=client,
                 retriever=None,  # We use raw Weaviate client for queries
                 text_embedder=text_embedder,
+                batch_embedder=batch_embedder,
                 collection_name=collection_name,
             )
 
@@ -195,7 +205,7 @@ class RAGPipeline:
     @classmethod
     def build_index_from_local(
         cls,
-        data_dir: Optional[Path] = None,
+        data_dir: Path | None = None,
         pattern: str = "*",
     ) -> None:
         """
@@ -261,7 +271,7 @@ class RAGPipeline:
             if result.errors:
                 logger.warning("Errors during ingestion: %s", result.errors)
 
-    def run(self, query: str, top_k: int = 5) -> List[Document]:
+    def run(self, query: str, top_k: int = 5, query_embedding: list[float] | None = None) -> list[Document]:
         """
         Retrieve relevant documents using Hybrid Search.
         
@@ -271,19 +281,91 @@ class RAGPipeline:
         Args:
             query: Search query
             top_k: Number of results to return (default: 5)
+            query_embedding: Precomputed embedding of ``query`` (skips embedding)
             
         Returns:
             List of relevant documents with optimized content length
         """
         logger.info("Retrieving top_k=%d for query='%s'", top_k, query)
 
-        # Generate query embedding
-        emb_result = self.text_embedder.run(text=query)
-        query_embedding = emb_result["embedding"]
+        # Generate query embedding unless the caller already has one
+        if query_embedding is None:
+            query_embedding = self.embed_query(query)
 
         # Get Weaviate collection
         collection = self.client.collections.get(self.collection_name)
+        self._check_collection(collection)
+
+        return self._hybrid_search(collection, query, query_embedding, top_k)
+
+    def embed_query(self, query: str) -> list[float]:
+        """
+        Embed a query with the pipeline's text embedder.
+        
+        Args:
+            query: Query text
+            
+        Returns:
+            Query embedding
+        """
+        return self.text_embedder.run(text=query)["embedding"]
+
+    def run_batch(
+        self,
+        queries: list[str],
+        top_k: int = 5,
+        query_embeddings: list[list[float]] | None = None,
+    ) -> list[list[Document]]:
+        """
+        Retrieve relevant documents for several queries at once.
+        
+        All queries are embedded in a single batched encoder call and the
+        collection diagnostic runs once, then each query gets its own hybrid
+        search (Weaviate has no multi-query hybrid endpoint).
+        
+        Args:
+            queries: Search queries
+            top_k: Number of results to return per query (default: 5)
+            query_embeddings: Precomputed embeddings of ``queries`` (skips embedding)
+            
+        Returns:
+            One document list per query, in the same order as ``queries``
+        """
+        if not queries:
+            return []
+
+        logger.info("Retrieving top_k=%d for %d queries (batched)", top_k, len(queries))
+
+        embeddings = query_embeddings if query_embeddings is not None else self.embed_queries(queries)
+
+        collection = self.client.collections.get(self.collection_name)
+        self._check_collection(collection)
 
+        return [
+            self._hybrid_search(collection, query, embedding, top_k)
+            for query, embedding in zip(queries, embeddings, strict=True)
+        ]
+
+    def embed_queries(self, queries: list[str]) -> list[list[float]]:
+        """
+        Embed several queries in a single batched encoder call.
+        
+        Args:
+            queries: Search queries
+            
+        Returns:
+            One embedding per query, in the same order as ``queries``
+        """
+        documents = self.batch_embedder.run(documents=[Document(content=query) for query in queries])
+        return [document.embedding for document in documents["documents"]]
+
+    def _check_collection(self, collection) -> None:
+        """
+        Log whether the collection holds any data before querying.
+        
+        Args:
+            collection: Weaviate collection handle
+        """
         # DIAGNOSTIC: Check if collection has any documents before querying
         try:
             # Quick sanity check - fetch 1 object to verify collection has data
@@ -303,6 +385,19 @@ class RAGPipeline:
         except Exception as diag_error:
             logger.warning("Pre-query diagnostic failed: %s", diag_error)
 
+    def _hybrid_search(self, collection, query: str, query_embedding: list[float], top_k: int) -> list[Document]:
+        """
+        Run one hybrid search and convert the hits to truncated Haystack Documents.
+        
+        Args:
+            collection: Weaviate collection handle
+            query: Search query (BM25 part)
+            query_embedding: Embedding of the query (vector part)
+            top_k: Number of results to return
+            
+        Returns:
+            List of relevant documents with optimized content length
+        """
         # Hybrid search: alpha=0.55 favors vector search over BM25
         # This balances semantic understanding with keyword matching
         response = collection.query.hybrid(
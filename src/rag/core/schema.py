@@ -123,19 +123,23 @@ class SchemaManager:
     Attributes:
         client: Weaviate client instance
         allow_reset: If True, auto-reset schema on mismatch (dev mode only)
+        vector_quantization: Vector index compression used when creating the collection
         collection_name: Name of the Weaviate collection
     """
 
-    def __init__(self, client, allow_reset: bool = False):
+    def __init__(self, client, allow_reset: bool = False, vector_quantization: str = "none"):
         """
         Initialize schema manager.
         
         Args:
             client: Weaviate client instance
             allow_reset: If True, auto-reset schema on mismatch (dev mode)
+            vector_quantization: "none" (float32 vectors) or "sq" (8-bit scalar
+                quantization; ~4x smaller index, faster distance computations)
         """
         self.client = client
         self.allow_reset = allow_reset
+        self.vector_quantization = vector_quantization
         self.collection_name = RESEARCH_DOCUMENT_SCHEMA["class"]
 
     def ensure_schema(self) -> None:
@@ -264,14 +268,32 @@ class SchemaManager:
                     )
                 )
 
+            # Optional int8 HNSW index; SQ rescores candidates with the
+            # original vectors, so recall loss stays small
+            vector_index_config = None
+            if self.vector_quantization == "sq":
+                vector_index_config = Configure.VectorIndex.hnsw(
+                    quantizer=Configure.VectorIndex.Quantizer.sq()
+                )
+            elif self.vector_quantization != "none":
+                logger.warning(
+                    "Unknown vector quantization '%s' - using uncompressed vectors",
+                    self.vector_quantization,
+                )
+
             # Create collection
             self.client.collections.create(
                 name=self.collection_name,
                 description=RESEARCH_DOCUMENT_SCHEMA["description"],
                 properties=properties,
+                vector_index_config=vector_index_config,
             )
 
-            logger.info("✓ Created collection '%s'", self.collection_name)
+            logger.info(
+                "✓ Created collection '%s' (vector quantization: %s)",
+                self.collection_name,
+                self.vector_quantization,
+            )
 
         except Exception as e:
             logger.error("Failed to create schema: %s", e)
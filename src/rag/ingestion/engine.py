@@ -93,6 +93,7 @@ class IngestionEngine:
         self.schema_manager = SchemaManager(
             client=self.client,
             allow_reset=allow_reset,
+            vector_quantization=self.config.weaviate.vector_quantization,
         )
 
         # Ensure schema exists
@@ -50,10 +50,12 @@ class LLMConfig:
         provider: LLM provider name (e.g., "ollama")
         model: Model identifier (e.g., "qwen2.5:3b")
         host: Service URL (e.g., "http://ollama:11434")
+        request_timeout: Timeout for a single LLM request in seconds
     """
     provider: str = "ollama"
     model: str = "qwen2.5:3b"
     host: str = "http://ollama:11434"
+    request_timeout: int = 300
 
 
 @dataclass
@@ -88,10 +90,24 @@ class CrewConfig:
         process: Execution process type ("sequential" or "hierarchical")
         memory: Enable crew memory across executions
         cache: Enable LLM response caching
+        semantic_cache: Serve API results for near-duplicate topics from a cache
+        semantic_cache_size: Max results kept by the runner's semantic cache
+        semantic_cache_threshold: Min topic similarity to serve a cached result
+        max_concurrency: Default number of crew runs in flight for batch runs
+        output_dir: Base directory for saved crew outputs
+        batch_max_size: Max API topics grouped into one batched run (1 = no batching)
+        batch_max_wait_ms: How long the first queued topic waits for others to join
     """
     process: str = "sequential"
     memory: bool = False
     cache: bool = True
+    semantic_cache: bool = False
+    semantic_cache_size: int = 128
+    semantic_cache_threshold: float = 0.95
+    max_concurrency: int = 4
+    output_dir: str = "outputs"
+    batch_max_size: int = 1
+    batch_max_wait_ms: int = 75
 
 
 @dataclass
@@ -117,12 +133,16 @@ class RAGConfig:
         chunk_size: Document chunk size in characters
         chunk_overlap: Overlap between consecutive chunks
         top_k: Number of documents to retrieve
+        max_context_tokens: Approximate token budget for formatted agent context
+        retrieval_cache_ttl: Seconds a runner reuses results for a repeated topic (0 = off, the default)
         allow_schema_reset: Allow destructive schema operations (dev only)
     """
     backend: str = "weaviate"
     chunk_size: int = 350
     chunk_overlap: int = 60
     top_k: int = 5
+    max_context_tokens: int = 4000
+    retrieval_cache_ttl: int = 0
     allow_schema_reset: bool = False
 
 
@@ -137,12 +157,14 @@ class WeaviateConfig:
         index_name: Collection/index name
         text_key: Property name for text content
         embedding_model: Model for generating embeddings
+        vector_quantization: Vector index compression for new collections ("none" or "sq")
     """
     url: str = "http://weaviate:8080"
     api_key: Optional[str] = None
     index_name: str = "research_assistant"
     text_key: str = "content"
     embedding_model: str = "sentence-transformers/all-MiniLM-L6-v2"
+    vector_quantization: str = "none"
 
 
 @dataclass
@@ -264,10 +286,13 @@ def load_config() -> AppConfig:
     
     llm_host = os.getenv("OLLAMA_HOST", llm_y.get("host", "http://ollama:11434"))
 
+    llm_request_timeout = int(os.getenv("OLLAMA_TIMEOUT", llm_y.get("request_timeout", 300)))
+
     llm = LLMConfig(
         provider=llm_y.get("provider", "ollama"),
         model=llm_model,
         host=llm_host,
+        request_timeout=llm_request_timeout,
     )
 
     # Agent LLM Configuration
@@ -305,10 +330,34 @@ def load_config() -> AppConfig:
     else:
         crew_cache = bool(crew_y.get("cache", True))
 
+    crew_semantic_cache_env = os.getenv("CREW_SEMANTIC_CACHE", "").lower()
+    if crew_semantic_cache_env:
+        crew_semantic_cache = crew_semantic_cache_env in {"1", "true", "yes"}
+    else:
+        crew_semantic_cache = bool(crew_y.get("semantic_cache", False))
+
+    crew_semantic_cache_size = int(
+        os.getenv("CREW_SEMANTIC_CACHE_SIZE", crew_y.get("semantic_cache_size", 128))
+    )
+    crew_semantic_cache_threshold = float(
+        os.getenv("CREW_SEMANTIC_CACHE_THRESHOLD", crew_y.get("semantic_cache_threshold", 0.95))
+    )
+    crew_max_concurrency = int(os.getenv("CREW_MAX_CONCURRENCY", crew_y.get("max_concurrency", 4)))
+    crew_output_dir = os.getenv("CREW_OUTPUT_DIR", crew_y.get("output_dir", "outputs"))
+    crew_batch_max_size = int(os.getenv("CREW_BATCH_MAX_SIZE", crew_y.get("batch_max_size", 1)))
+    crew_batch_max_wait_ms = int(os.getenv("CREW_BATCH_MAX_WAIT_MS", crew_y.get("batch_max_wait_ms", 75)))
+
     crew = CrewConfig(
         process=crew_process,
         memory=crew_memory,
         cache=crew_cache,
+        semantic_cache=crew_semantic_cache,
+        semantic_cache_size=crew_semantic_cache_size,
+        semantic_cache_threshold=crew_semantic_cache_threshold,
+        max_concurrency=crew_max_concurrency,
+        output_dir=crew_output_dir,
+        batch_max_size=crew_batch_max_size,
+        batch_max_wait_ms=crew_batch_max_wait_ms,
     )
 
     agents = AgentsConfig(llm=agent_llm, crew=crew)
@@ -317,6 +366,12 @@ def load_config() -> AppConfig:
     rag_chunk_size = int(os.getenv("RAG_CHUNK_SIZE", rag_y.get("chunk_size", 350)))
     rag_chunk_overlap = int(os.getenv("RAG_CHUNK_OVERLAP", rag_y.get("chunk_overlap", 60)))
     rag_top_k = int(os.getenv("RAG_TOP_K", rag_y.get("top_k", 5)))
+    rag_max_context_tokens = int(
+        os.getenv("RAG_MAX_CONTEXT_TOKENS", rag_y.get("max_context_tokens", 4000))
+    )
+    rag_retrieval_cache_ttl = int(
+        os.getenv("RAG_RETRIEVAL_CACHE_TTL", rag_y.get("retrieval_cache_ttl", 0))
+    )
     
     allow_reset_env = os.getenv("ALLOW_SCHEMA_RESET", "").lower()
     if allow_reset_env:
@@ -329,6 +384,8 @@ def load_config() -> AppConfig:
         chunk_size=rag_chunk_size,
         chunk_overlap=rag_chunk_overlap,
         top_k=rag_top_k,
+        max_context_tokens=rag_max_context_tokens,
+        retrieval_cache_ttl=rag_retrieval_cache_ttl,
         allow_schema_reset=allow_reset,
     )
 
@@ -338,6 +395,9 @@ def load_config() -> AppConfig:
     weav_index = os.getenv("WEAVIATE_INDEX_NAME", weav_y.get("index_name", "research_assistant"))
     weav_text_key = weav_y.get("text_key", "content")
     weav_embedding_model = weav_y.get("embedding_model", "sentence-transformers/all-MiniLM-L6-v2")
+    weav_quantization = os.getenv(
+        "WEAVIATE_VECTOR_QUANTIZATION", weav_y.get("vector_quantization", "none")
+    ).lower()
 
     weaviate = WeaviateConfig(
         url=weav_url,
@@ -345,6 +405,7 @@ def load_config() -> AppConfig:
         index_name=weav_index,
         text_key=weav_text_key,
         embedding_model=weav_embedding_model,
+        vector_quantization=weav_quantization,
     )
 
     # Guardrails Configuration
@@ -0,0 +1,39 @@
+"""
+Pytest configuration.
+
+Shared fixtures for the unit tests. Unit tests run without Docker
+services: Weaviate, Ollama and TruLens are never contacted.
+"""
+from __future__ import annotations
+
+import os
+
+import pytest
+
+# Keep third-party telemetry quiet when CrewAI/Haystack are imported
+os.environ.setdefault("CREWAI_DISABLE_TELEMETRY", "true")
+os.environ.setdefault("HAYSTACK_TELEMETRY_ENABLED", "False")
+os.environ.setdefault("OTEL_SDK_DISABLED", "true")
+
+
+@pytest.fixture
+def runner():
+    """CrewRunner without monitoring; heavy components stay unbuilt."""
+    from src.agents.runner import CrewRunner
+
+    crew_runner = CrewRunner(enable_monitoring=False)
+    yield crew_runner
+    crew_runner.close()
+
+
+@pytest.fixture
+def make_result():
+    """Factory for CrewResult objects with sensible defaults."""
+    from src.agents.runner import CrewResult
+
+    def _make(topic: str = "What is RAG?", language: str = "en", **kwargs) -> CrewResult:
+        kwargs.setdefault("final_output", f"Summary of {topic}")
+        kwargs.setdefault("context_docs", [])
+        return CrewResult(topic=topic, language=language, **kwargs)
+
+    return _make
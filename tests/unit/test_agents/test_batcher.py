@@ -0,0 +1,131 @@
+"""Tests for the topic batcher (src/agents/batcher.py)."""
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from src.agents.batcher import TopicBatcher
+
+
+class FakeRunner:
+    """Stands in for CrewRunner.run_batch() and records each batch."""
+
+    def __init__(self, fail_with: Exception | None = None):
+        self.batches: list[list[str]] = []
+        self.fail_with = fail_with
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def run_batch(self, topics, languages):
+        self.batches.append(list(topics))
+        await self.release.wait()
+        if self.fail_with is not None:
+            raise self.fail_with
+        return [
+            ValueError(topic) if topic.startswith("bad") else f"{topic}:{language}"
+            for topic, language in zip(topics, languages, strict=True)
+        ]
+
+
+@pytest.mark.asyncio
+async def test_flushes_when_batch_is_full():
+    """A full batch is dispatched without waiting for max_wait."""
+    runner = FakeRunner()
+    batcher = TopicBatcher(runner, max_batch=2, max_wait=60)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(batcher.submit("a", "en"), batcher.submit("b", "de")), timeout=5
+    )
+
+    assert results == ["a:en", "b:de"]
+    assert runner.batches == [["a", "b"]]
+    await batcher.close()
+
+
+@pytest.mark.asyncio
+async def test_flushes_after_max_wait():
+    """A lone topic is dispatched once max_wait elapses."""
+    runner = FakeRunner()
+    batcher = TopicBatcher(runner, max_batch=8, max_wait=0.01)
+
+    result = await asyncio.wait_for(batcher.submit("a"), timeout=5)
+
+    assert result == "a:en"
+    assert runner.batches == [["a"]]
+    await batcher.close()
+
+
+@pytest.mark.asyncio
+async def test_splits_topics_beyond_max_batch():
+    """Topics beyond max_batch go into the next batch."""
+    runner = FakeRunner()
+    batcher = TopicBatcher(runner, max_batch=2, max_wait=0.05)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(*(batcher.submit(topic) for topic in "abc")), timeout=5
+    )
+
+    assert results == ["a:en", "b:en", "c:en"]
+    assert runner.batches == [["a", "b"], ["c"]]
+    await batcher.close()
+
+
+@pytest.mark.asyncio
+async def test_per_topic_errors_reach_their_caller():
+    """A failed topic raises for its caller only."""
+    runner = FakeRunner()
+    batcher = TopicBatcher(runner, max_batch=2, max_wait=60)
+
+    good, bad = await asyncio.gather(
+        batcher.submit("good"), batcher.submit("bad"), return_exceptions=True
+    )
+
+    assert good == "good:en"
+    assert isinstance(bad, ValueError)
+    await batcher.close()
+
+
+@pytest.mark.asyncio
+async def test_batch_failure_fans_out_to_all_callers():
+    """If the whole batch fails, every caller gets the exception."""
+    error = RuntimeError("crew down")
+    batcher = TopicBatcher(FakeRunner(fail_with=error), max_batch=2, max_wait=60)
+
+    results = await asyncio.gather(batcher.submit("a"), batcher.submit("b"), return_exceptions=True)
+
+    assert results == [error, error]
+    await batcher.close()
+
+
+@pytest.mark.asyncio
+async def test_close_waits_for_running_batches():
+    """close() lets dispatched batches finish."""
+    runner = FakeRunner()
+    runner.release.clear()
+    batcher = TopicBatcher(runner, max_batch=1, max_wait=0)
+    submitted = asyncio.create_task(batcher.submit("a"))
+    await asyncio.sleep(0.01)
+
+    closing = asyncio.create_task(batcher.close())
+    await asyncio.sleep(0.01)
+    assert not closing.done()
+
+    runner.release.set()
+    await asyncio.wait_for(closing, timeout=5)
+    assert await submitted == "a:en"
+
+
+@pytest.mark.asyncio
+async def test_close_fails_undispatched_topics():
+    """Topics still collecting when close() runs fail instead of hanging."""
+    runner = FakeRunner()
+    batcher = TopicBatcher(runner, max_batch=8, max_wait=60)
+    submitted = asyncio.create_task(batcher.submit("a"))
+    await asyncio.sleep(0.01)
+
+    await batcher.close()
+
+    with pytest.raises(RuntimeError, match="closed"):
+        await asyncio.wait_for(submitted, timeout=5)
+    assert runner.batches == []
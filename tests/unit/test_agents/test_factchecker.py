@@ -0,0 +1,134 @@
+"""Tests for the factchecker task's reference data (src/agents/tasks/factchecker.py)."""
+from __future__ import annotations
+
+from unittest.mock import Mock
+
+import pytest
+from haystack.dataclasses import Document
+
+from src.agents.crews import research_crew
+from src.agents.crews.research_crew import ResearchCrew
+from src.agents.tasks import factchecker
+from src.agents.tasks.factchecker import (
+    _DESCRIPTION_PREFIX,
+    _DESCRIPTION_SUFFIX,
+    _REFERENCE_DATA_HEADER,
+    _reference_data,
+    create_factchecker_task,
+)
+
+
+@pytest.fixture
+def raw_context(runner):
+    """Context as CrewRunner hands it to the crew, before summarization."""
+    body = "Retrieval-augmented generation grounds model answers in retrieved passages. " * 2
+    docs = [
+        Document(
+            content=body,
+            meta={"source": "lewis2020.pdf", "title": "Retrieval-Augmented\nGeneration", "year": 2020},
+        ),
+        Document(content=body + "More.", meta={"source": "notes.txt", "authors": "Doe, J.\nRoe, R."}),
+        Document(content=body + "Again.", meta={"source": "lewis2020.pdf", "title": "Retrieval-Augmented\nGeneration"}),
+    ]
+    return runner._format_context(docs, runner._index_sources(docs))
+
+
+@pytest.fixture
+def crew():
+    """ResearchCrew without agents; only its context helpers are used."""
+    return ResearchCrew.__new__(ResearchCrew)
+
+
+def test_reference_data_one_line_per_source():
+    """Each cited source is listed once, in citation order."""
+    context = (
+        "SOURCE [2]: b.pdf\nMETADATA: Second Paper, Year: 2021\nBody two\n\n"
+        "SOURCE [1]: a.pdf\nMETADATA: First Paper, Authors: Doe, J., Year: 2020\nBody one\n\n"
+        "SOURCE [2]: b.pdf\nMETADATA: Second Paper, Year: 2021\nMore of body two\n"
+    )
+
+    assert _reference_data(context, context) == (
+        "[1] a.pdf - First Paper, Authors: Doe, J., Year: 2020\n"
+        "[2] b.pdf - Second Paper, Year: 2021"
+    )
+
+
+def test_reference_data_skips_sources_without_metadata():
+    """A header without a METADATA line contributes nothing."""
+    context = "SOURCE [1]: notes.txt\nPlain body\n\nSOURCE [2]: b.pdf\nMETADATA: Title\nBody\n"
+
+    assert _reference_data(context, context) == "[2] b.pdf - Title"
+
+
+def test_reference_data_ignores_metadata_outside_headers():
+    """METADATA lines inside a chunk body are not mistaken for headers."""
+    context = (
+        "SOURCE [1]: a.pdf\nBody line\nMETADATA: quoted from the paper\n"
+        "SOURCE [2]: b.pdf\nMETADATA: Real Title\nBody spanning\nseveral\nlines\n"
+    )
+
+    assert _reference_data(context, context) == "[2] b.pdf - Real Title"
+
+
+def test_reference_data_only_lists_shown_sources():
+    """Sources dropped from the factchecker's SOURCES are not listed."""
+    raw = "SOURCE [1]: a.pdf\nMETADATA: First\nBody\nSOURCE [2]: b.pdf\nMETADATA: Second\nBody\n"
+
+    assert _reference_data(raw, "SOURCE [2]\n: b.pdf\nBody\n") == "[2] b.pdf - Second"
+
+
+def test_reference_data_empty_without_headers():
+    """Plain or missing context yields no reference block."""
+    assert _reference_data("NO CONTEXT AVAILABLE", "NO CONTEXT AVAILABLE") == ""
+
+
+def test_multiline_metadata_round_trips(raw_context):
+    """Titles and authors with line breaks are flattened so the whole header is parsed back."""
+    assert _reference_data(raw_context, raw_context) == (
+        "[1] lewis2020.pdf - Retrieval-Augmented Generation, Year: 2020\n"
+        "[2] notes.txt - Authors: Doe, J. Roe, R."
+    )
+
+
+def test_reference_data_survives_summarized_sources(crew, raw_context, monkeypatch):
+    """The summarized SOURCES still get reference data read from the raw context."""
+    task_cls = Mock()
+    monkeypatch.setattr(factchecker, "Task", task_cls)
+    summarized = crew._summarize_sources(raw_context, "What is RAG?")
+
+    create_factchecker_task(agent=None, reviewer_task=None, context=summarized, source_context=raw_context)
+
+    description = task_cls.call_args.kwargs["description"]
+    assert description.startswith(_DESCRIPTION_PREFIX + summarized + _REFERENCE_DATA_HEADER)
+    assert "[1] lewis2020.pdf - Retrieval-Augmented Generation, Year: 2020" in description
+    assert "[2] notes.txt - Authors: Doe, J. Roe, R." in description
+
+
+def test_default_mode_passes_raw_context_to_factchecker(crew, raw_context, monkeypatch):
+    """The factchecker task sees summarized SOURCES plus the raw context for references."""
+    make_task = Mock()
+    for name in ("create_writer_task", "create_reviewer_task"):
+        monkeypatch.setattr(research_crew, name, Mock())
+    monkeypatch.setattr(research_crew, "create_factchecker_task", make_task)
+    monkeypatch.setattr(research_crew, "Crew", Mock())
+    crew.writer = crew.reviewer = crew.factchecker = None
+    monkeypatch.setattr(crew, "_format_output", lambda result, mode: "summary")
+
+    crew._run_default_mode("What is RAG?", raw_context, "en")
+
+    kwargs = make_task.call_args.kwargs
+    assert kwargs["context"] == crew._summarize_sources(raw_context, "What is RAG?")
+    assert kwargs["source_context"] == raw_context
+
+
+def test_task_description_includes_reference_data(monkeypatch):
+    """The reference block sits between the sources and the instructions."""
+    task_cls = Mock()
+    monkeypatch.setattr(factchecker, "Task", task_cls)
+    context = "SOURCE [1]: a.pdf\nMETADATA: Title\nBody\n"
+
+    create_factchecker_task(agent=None, reviewer_task=None, context=context)
+
+    assert task_cls.call_args.kwargs["description"] == "".join(
+        (_DESCRIPTION_PREFIX, context, _REFERENCE_DATA_HEADER, "[1] a.pdf - Title", _DESCRIPTION_SUFFIX)
+    )
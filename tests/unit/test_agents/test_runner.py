@@ -0,0 +1,287 @@
+"""Tests for CrewRunner helpers that run without external services."""
+from __future__ import annotations
+
+import random
+import re
+import string
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+from haystack.dataclasses import Document
+
+from src.agents.cache import SemanticCache
+from src.agents.runner import CrewResult, CrewRunner, close_crew_runners, get_crew_runner
+from src.eval.performance import PerformanceTracker
+
+
+def test_semantic_cache_disabled_by_default(runner):
+    """The semantic cache is opt-in through config."""
+    assert runner.semantic_cache is None
+
+
+def test_semantic_cache_enabled_explicitly():
+    """Passing semantic_cache=True overrides the config default."""
+    crew_runner = CrewRunner(enable_monitoring=False, semantic_cache=True)
+    try:
+        assert crew_runner.semantic_cache is not None
+    finally:
+        crew_runner.close()
+
+
+def test_serve_cached_drops_trulens_eval_id(runner, make_result):
+    """A cache hit must not hand out the original request's evaluation id."""
+    cached = make_result(
+        "What is RAG?",
+        evaluation={"trulens_eval_id": "abc123", "guardrails": {"output_passed": True}},
+    )
+    tracker = PerformanceTracker()
+    tracker.start()
+
+    result = runner._serve_cached("Explain RAG", cached, 0.97, tracker)
+
+    assert result.topic == "Explain RAG"
+    assert "trulens_eval_id" not in result.evaluation
+    assert result.evaluation["guardrails"] == {"output_passed": True}
+    assert result.evaluation["semantic_cache"] == {"similarity": 0.97, "cached_topic": "What is RAG?"}
+    assert cached.evaluation["trulens_eval_id"] == "abc123"
+
+
+@pytest.fixture
+def batch_runner(runner, monkeypatch):
+    """Runner with a fake RAG pipeline, input check and crew for run_batch()."""
+    pipeline = Mock()
+    embeddings = {"alpha": [1.0, 0.0, 0.0], "beta": [0.0, 1.0, 0.0]}
+    pipeline.embed_queries.side_effect = lambda topics: [embeddings.get(t, [0.0, 0.0, 1.0]) for t in topics]
+    pipeline.run_batch.side_effect = lambda queries, top_k, query_embeddings: [
+        [Document(content=f"About {query}", meta={"source": f"{query}.pdf"})] for query in queries
+    ]
+    runner.__dict__["rag_pipeline"] = pipeline
+
+    def validate(topic):
+        passed = not topic.startswith("blocked")
+        return passed, (SimpleNamespace(passed=passed, message="blocked topic"),)
+
+    runner.__dict__["_validate_input"] = validate
+
+    generated = []
+
+    def generate(topic, language, context, docs, source_map, tracker):
+        if topic.startswith("crash"):
+            raise RuntimeError("crew failed")
+        generated.append(topic)
+        tracker.stop()
+        return CrewResult(
+            topic=topic,
+            language=language,
+            final_output=context,
+            context_docs=docs,
+            evaluation={"guardrails": {"output_passed": True}},
+            source_map=source_map,
+        )
+
+    monkeypatch.setattr(runner, "_generate", generate)
+    monkeypatch.setattr(runner, "_warm_crew", lambda: None)
+    runner.generated = generated
+    return runner
+
+
+@pytest.mark.asyncio
+async def test_run_batch_shares_embedding_and_retrieval(batch_runner):
+    """One embedding pass and one retrieval call serve the whole batch."""
+    results = await batch_runner.run_batch(["alpha", "beta"], ["en", "de"])
+
+    assert [r.topic for r in results] == ["alpha", "beta"]
+    assert [r.language for r in results] == ["en", "de"]
+    assert "About alpha" in results[0].final_output
+    assert "About beta" in results[1].final_output
+    batch_runner.rag_pipeline.embed_queries.assert_called_once_with(["alpha", "beta"])
+    batch_runner.rag_pipeline.run_batch.assert_called_once()
+    _, kwargs = batch_runner.rag_pipeline.run_batch.call_args
+    assert kwargs["query_embeddings"] == [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]]
+
+
+@pytest.mark.asyncio
+async def test_run_batch_keeps_failures_in_their_slot(batch_runner):
+    """Rejected and failed topics do not affect the rest of the batch."""
+    results = await batch_runner.run_batch(["alpha", "blocked topic", "crash now"])
+
+    assert results[0].topic == "alpha"
+    assert "blocked topic" in results[1].final_output
+    assert isinstance(results[2], RuntimeError)
+    assert batch_runner.generated == ["alpha"]
+
+
+@pytest.mark.asyncio
+async def test_run_batch_serves_semantic_cache_hits(batch_runner):
+    """Cached topics skip retrieval and the crew."""
+    batch_runner.semantic_cache = SemanticCache(max_entries=4, threshold=0.99)
+
+    await batch_runner.run_batch(["alpha"])
+    results = await batch_runner.run_batch(["alpha", "gamma"])
+
+    assert results[0].evaluation["semantic_cache"]["cached_topic"] == "alpha"
+    assert results[1].topic == "gamma"
+    assert batch_runner.generated == ["alpha", "gamma"]
+    _, kwargs = batch_runner.rag_pipeline.run_batch.call_args
+    assert kwargs["queries"] == ["gamma"]
+
+
+@pytest.mark.asyncio
+async def test_run_batch_rejects_mismatched_languages(batch_runner):
+    """A language list of the wrong length is an error, not a silent truncation."""
+    with pytest.raises(ValueError):
+        await batch_runner.run_batch(["alpha", "beta"], ["en"])
+
+
+def _legacy_slugify(topic: str) -> str:
+    """Two-regex slug implementation that _slugify_topic replaced."""
+    slug = re.sub(r"[^\w\s-]", "", topic.lower())
+    slug = re.sub(r"[\s_]+", "_", slug)
+    return slug[:50]
+
+
+@pytest.mark.parametrize(
+    "topic",
+    [
+        "What is RAG?",
+        "  leading and trailing  ",
+        "snake_case  and__double___underscores",
+        "a ! b",
+        "Hyphen-ated -- words",
+        "Übersicht über Retrieval-Augmented Generation",
+        "数据 检索\t\n增强",
+        "İstanbul ǅ ﬁ",
+        "",
+        "x" * 80,
+        ("word " * 20).strip(),
+    ],
+)
+def test_slugify_matches_legacy_regexes(runner, topic):
+    """The single-pass slug equals the old regex slug."""
+    assert runner._slugify_topic(topic) == _legacy_slugify(topic)
+
+
+def test_slugify_matches_legacy_regexes_randomized(runner):
+    """Random mixed-script topics slugify exactly like the old regexes."""
+    rng = random.Random(0)
+    alphabet = string.ascii_letters + string.digits + string.punctuation + " \t\n_-" + "äöüßéİ数据ǅ٣"
+    for _ in range(2000):
+        topic = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 70)))
+        assert runner._slugify_topic(topic) == _legacy_slugify(topic), topic
+
+
+def test_dedupe_keeps_first_occurrence_in_order():
+    """Repeated chunk text is dropped; survivors keep relevance order."""
+    docs = [
+        Document(content="alpha", meta={"source": "a.pdf"}),
+        Document(content="beta", meta={"source": "b.pdf"}),
+        Document(content="  alpha\n", meta={"source": "c.pdf"}),
+        Document(content="gamma", meta={"source": "a.pdf"}),
+        Document(content="beta", meta={"source": "b.pdf"}),
+    ]
+
+    unique = CrewRunner._dedupe_documents(docs)
+
+    assert unique == [docs[0], docs[1], docs[3]]
+
+
+def test_dedupe_keys_on_content_not_source():
+    """Different chunks from one source are all kept."""
+    docs = [
+        Document(content="first", meta={"source": "a.pdf"}),
+        Document(content="second", meta={"source": "a.pdf"}),
+    ]
+
+    assert CrewRunner._dedupe_documents(docs) == docs
+
+
+@pytest.mark.parametrize(
+    ("budget", "kept"),
+    [
+        (1, 1),    # the first document is always kept
+        (9, 1),    # crossing the budget keeps the crossing document
+        (10, 1),   # reaching it exactly stops right there
+        (11, 2),
+        (20, 2),
+        (21, 3),
+        (100, 3),  # everything fits
+    ],
+)
+def test_budget_cutoff_at_boundary(runner, budget, kept):
+    """Documents are yielded until the running length reaches the budget."""
+    docs = [Document(content="x" * 10) for _ in range(3)]
+    runner.max_context_chars = budget
+
+    assert list(runner._iter_within_budget(docs)) == docs[:kept]
+
+
+def test_build_context_dedupes_before_budget(runner):
+    """Duplicates do not push unique chunks out of the budget."""
+    docs = [
+        Document(content="a" * 10, meta={"source": "a.pdf"}),
+        Document(content="a" * 10, meta={"source": "a.pdf"}),
+        Document(content="b" * 10, meta={"source": "b.pdf"}),
+    ]
+    runner.max_context_chars = 20
+
+    context, kept, source_map = runner._build_context(docs)
+
+    assert kept == [docs[0], docs[2]]
+    assert source_map == {"a.pdf": 1, "b.pdf": 2}
+    assert "SOURCE [2]: b.pdf" in context
+
+
+def test_close_crew_runners_closes_every_configuration(monkeypatch):
+    """Each cached runner is closed once and later calls build fresh ones."""
+    closed = []
+    monkeypatch.setattr(CrewRunner, "close", lambda self: closed.append(self))
+    first = get_crew_runner(enable_monitoring=False)
+    second = get_crew_runner(enable_monitoring=False, enable_guardrails=False)
+    assert get_crew_runner(enable_monitoring=False) is first
+
+    close_crew_runners()
+
+    assert closed == [first, second]
+    assert get_crew_runner(enable_monitoring=False) is not first
+    close_crew_runners()
+
+
+def test_close_crew_runners_builds_nothing(monkeypatch):
+    """Closing with no cached runners does not create one."""
+    close_crew_runners()
+    built = Mock()
+    monkeypatch.setattr("src.agents.runner.CrewRunner.__init__", built)
+
+    close_crew_runners()
+
+    built.assert_not_called()
+
+
+def test_retrieval_cache_off_by_default(runner):
+    """Repeated topics search again unless rag.retrieval_cache_ttl is set."""
+    pipeline = Mock()
+    pipeline.run.return_value = [Document(content="About RAG", meta={"source": "a.pdf"})]
+    pipeline.embed_query.return_value = [1.0, 0.0]
+    runner.__dict__["rag_pipeline"] = pipeline
+
+    runner.retrieve_context("What is RAG?")
+    runner.retrieve_context("What is RAG?")
+
+    assert pipeline.run.call_count == 2
+
+
+def test_retrieval_cache_reuses_results_within_ttl(runner):
+    """With a TTL, a repeated topic is served from the cache until invalidated."""
+    pipeline = Mock()
+    pipeline.run.return_value = [Document(content="About RAG", meta={"source": "a.pdf"})]
+    pipeline.embed_query.return_value = [1.0, 0.0]
+    runner.__dict__["rag_pipeline"] = pipeline
+    runner.config.rag.retrieval_cache_ttl = 300
+
+    runner.retrieve_context("What is RAG?")
+    runner.retrieve_context("What is RAG?")
+    runner.invalidate_retrieval_cache()
+    runner.retrieve_context("What is RAG?")
+
+    assert pipeline.run.call_count == 2
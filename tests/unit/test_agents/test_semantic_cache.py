@@ -0,0 +1,135 @@
+"""Tests for the semantic result cache (src/agents/cache.py)."""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from src.agents.cache import SemanticCache
+
+
+def _unit(*values: float) -> list[float]:
+    """Return a unit-length embedding."""
+    vector = np.asarray(values, dtype=np.float32)
+    return (vector / np.linalg.norm(vector)).tolist()
+
+
+def test_lookup_empty_cache_misses():
+    """An empty cache never returns a hit."""
+    cache = SemanticCache(max_entries=4, threshold=0.9)
+
+    assert cache.lookup(_unit(1, 0, 0), "en") is None
+    assert len(cache) == 0
+
+
+def test_lookup_hit_above_threshold(make_result):
+    """A near-duplicate topic in the same language is served from the cache."""
+    cache = SemanticCache(max_entries=4, threshold=0.95)
+    result = make_result("What is RAG?")
+    cache.add(_unit(1, 0.1, 0), result)
+
+    hit = cache.lookup(_unit(1, 0.12, 0), "en")
+
+    assert hit is not None
+    cached, similarity = hit
+    assert cached is result
+    assert 0.95 <= similarity <= 1.01
+
+
+def test_lookup_miss_below_threshold(make_result):
+    """A dissimilar topic is not served from the cache."""
+    cache = SemanticCache(max_entries=4, threshold=0.95)
+    cache.add(_unit(1, 0, 0), make_result())
+
+    # cos(45°) ≈ 0.71
+    assert cache.lookup(_unit(1, 1, 0), "en") is None
+
+
+def test_lookup_miss_other_language(make_result):
+    """Identical embeddings never match across languages."""
+    cache = SemanticCache(max_entries=4, threshold=0.95)
+    cache.add(_unit(1, 0, 0), make_result(language="en"))
+
+    assert cache.lookup(_unit(1, 0, 0), "de") is None
+
+
+def test_lookup_returns_most_similar(make_result):
+    """The best-scoring entry wins when several exceed the threshold."""
+    cache = SemanticCache(max_entries=4, threshold=0.9)
+    far = make_result("far")
+    near = make_result("near")
+    cache.add(_unit(1, 0.4, 0), far)
+    cache.add(_unit(1, 0.05, 0), near)
+
+    cached, _ = cache.lookup(_unit(1, 0, 0), "en")
+
+    assert cached is near
+
+
+def test_lookup_dimension_mismatch_misses(make_result):
+    """An embedding of a different size is a miss, not an error."""
+    cache = SemanticCache(max_entries=4, threshold=0.9)
+    cache.add(_unit(1, 0, 0), make_result())
+
+    assert cache.lookup(_unit(1, 0), "en") is None
+
+
+def test_ring_eviction_overwrites_oldest(make_result):
+    """Once full, each add replaces the oldest entry."""
+    cache = SemanticCache(max_entries=2, threshold=0.99)
+    first = make_result("first")
+    second = make_result("second")
+    third = make_result("third")
+    cache.add(_unit(1, 0, 0), first)
+    cache.add(_unit(0, 1, 0), second)
+    cache.add(_unit(0, 0, 1), third)
+
+    assert len(cache) == 2
+    assert cache.lookup(_unit(1, 0, 0), "en") is None
+    assert cache.lookup(_unit(0, 1, 0), "en")[0] is second
+    assert cache.lookup(_unit(0, 0, 1), "en")[0] is third
+
+
+def test_clear_drops_entries(make_result):
+    """clear() empties the cache."""
+    cache = SemanticCache(max_entries=2, threshold=0.9)
+    cache.add(_unit(1, 0, 0), make_result())
+
+    cache.clear()
+
+    assert len(cache) == 0
+    assert cache.lookup(_unit(1, 0, 0), "en") is None
+
+
+def test_quantize_normalizes_and_scales():
+    """Quantized vectors use the full int8 range and dequantize to the unit vector."""
+    raw = [3.0, -4.0, 0.5, 0.0]
+
+    vector, scale = SemanticCache._quantize(raw)
+
+    assert vector.dtype == np.int8
+    assert int(np.abs(vector).max()) == 127
+    expected = np.asarray(raw, dtype=np.float32) / np.linalg.norm(raw)
+    np.testing.assert_allclose(vector * scale, expected, atol=scale)
+
+
+def test_quantize_zero_vector():
+    """A zero embedding quantizes to zeros without dividing by zero."""
+    vector, scale = SemanticCache._quantize([0.0, 0.0, 0.0])
+
+    assert not vector.any()
+    assert scale == 1.0
+
+
+@pytest.mark.parametrize("dim", [8, 384, 1024])
+def test_quantized_similarity_close_to_float(dim):
+    """int8 scores stay within a small error of the float32 cosine similarity."""
+    rng = np.random.default_rng(0)
+    a = rng.standard_normal(dim)
+    b = a + 0.3 * rng.standard_normal(dim)
+
+    qa, sa = SemanticCache._quantize(a)
+    qb, sb = SemanticCache._quantize(b)
+    quantized = float(qa.astype(np.int32) @ qb.astype(np.int32)) * sa * sb
+    exact = float(a @ b / (np.linalg.norm(a) * np.linalg.norm(b)))
+
+    assert quantized == pytest.approx(exact, abs=0.02)